@@ -37,6 +37,7 @@ class CacheManager:
     - Automatic expiration
     - LRU eviction when size limit exceeded
     - Persistent storage
+    - Grouped writes: inside ``with cache:`` the index is saved once on exit
     """
     
     def __init__(
@@ -63,6 +64,21 @@ class CacheManager:
         # In-memory index
         self.index: Dict[str, CacheEntry] = {}
         self._load_index()
+
+        # Set while grouping writes; index saves are postponed to __exit__
+        self._defer_flush = False
+        self._dirty = False
+    
+    def __enter__(self) -> "CacheManager":
+        with self.lock:
+            self._defer_flush = True
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        with self.lock:
+            self._defer_flush = False
+            if self._dirty:
+                self._save_index()
     
     def _load_index(self):
         """Load cache index from disk"""
@@ -83,6 +99,11 @@ class CacheManager:
     
     def _save_index(self):
         """Save cache index to disk"""
+        if self._defer_flush:
+            self._dirty = True
+            return
+        self._dirty = False
+
         index_file = self.cache_dir / "index.json"
         
         data = {
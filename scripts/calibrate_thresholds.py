@@ -2,7 +2,7 @@ import argparse
 import json
 from itertools import product
 from pathlib import Path
-from typing import Mapping, TypedDict
+from typing import Mapping, Sequence, TextIO, TypedDict
 
 
 LP_BUCKETS = ("lp_lt_20k", "lp_20k_100k", "lp_gt_100k")
@@ -200,14 +200,14 @@ def _normalize_record(row: Mapping[str, object]) -> ScoreRecord:
     }
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     _ = parser.add_argument("--input", required=True, type=Path)
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: Sequence[str] | None = None, stdout: TextIO | None = None) -> int:
+    args = parse_args(argv)
     with args.input.open("r", encoding="utf-8") as f:
         payload = json.load(f)
 
@@ -228,7 +228,7 @@ def main() -> int:
     result: dict[str, dict[str, BucketCalibration]] = {
         "buckets": calibrate_thresholds(records)
     }
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(json.dumps(result, ensure_ascii=False, indent=2), file=stdout)
     return 0
 
 
@@ -42,7 +42,8 @@ class ChainTrace:
             chain,
             max_retries=self.config.rpc.max_retries,
             timeout=self.config.rpc.timeout,
-            probe_on_init=self.config.rpc.probe_on_init
+            probe_on_init=self.config.rpc.probe_on_init,
+            lb_policy=self.config.rpc.lb_policy
         )
 
         # Initialize clients
@@ -51,6 +51,7 @@ class RPCConfig:
     max_retries: int = 3
     timeout: int = 12
     probe_on_init: bool = False
+    lb_policy: str = "rr"  # rr, least_latency, tier
 
 
 @dataclass
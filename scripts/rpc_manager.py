@@ -7,12 +7,19 @@ Based on research from:
 - Chainstack best practices
 """
 
+import json
 import time
 import random
-from typing import Dict, List, Optional, Any, Callable
+import socket
+import threading
+from collections import deque
+from operator import attrgetter
+from urllib.parse import urlparse
+from typing import Deque, Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 
 
@@ -41,6 +48,65 @@ class RPCEndpoint:
     total_requests: int = 0
     total_failures: int = 0
     avg_response_time: float = 0.0
+    rate: float = 5.0  # token refill rate (requests per second)
+    tokens: float = 5.0
+    last_refill: float = field(default_factory=time.monotonic)
+    _bucket_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+    _stats_dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._stats_dict = {"url": self.url, "tier": self.tier, "available": True}
+        self._refresh_stats()
+
+    def _refresh_stats(self):
+        """Update the cached stats dict in place after a health change"""
+        stats = self._stats_dict
+        stats["consecutive_failures"] = self.consecutive_failures
+        stats["total_requests"] = self.total_requests
+        stats["total_failures"] = self.total_failures
+        stats["success_rate"] = (
+            (self.total_requests - self.total_failures) / self.total_requests
+            if self.total_requests > 0 else 0
+        )
+        stats["avg_response_time"] = self.avg_response_time
+        stats["cooldown_until"] = self.cooldown_until.isoformat() if self.cooldown_until else None
+
+    def try_take_token(self) -> bool:
+        """Take one request token; False means the endpoint is being throttled"""
+        with self._bucket_lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            if self.tokens < 1.0:
+                return False
+            self.tokens -= 1.0
+            return True
+
+    def seconds_until_token(self) -> float:
+        """Time until the bucket refills to one whole token at its current rate"""
+        with self._bucket_lock:
+            tokens = min(self.rate, self.tokens + (time.monotonic() - self.last_refill) * self.rate)
+            return max(0.0, (1.0 - tokens) / self.rate)
+
+    def drain_tokens(self):
+        """Empty the bucket after a rate-limit response"""
+        with self._bucket_lock:
+            self.tokens = 0.0
+            self.last_refill = time.monotonic()
+
+    def mark_rate_limited(self):
+        """
+        Count a rate-limited request (HTTP 429 / -32005).
+
+        The bucket is drained so the endpoint is paced back in by its refill
+        rate; no cooldown is set, so it stays eligible for the next round.
+        """
+        self.drain_tokens()
+        self.total_failures += 1
+        self.total_requests += 1
+        self._refresh_stats()
 
     def is_available(self) -> bool:
         """Check if endpoint is available (not in cooldown)"""
@@ -57,6 +123,7 @@ class RPCEndpoint:
         alpha = 0.3
         self.avg_response_time = (alpha * response_time +
                                    (1 - alpha) * self.avg_response_time)
+        self._refresh_stats()
 
     def mark_failure(self, cooldown_base: int = 30):
         """Mark failed request and set cooldown"""
@@ -67,6 +134,7 @@ class RPCEndpoint:
         # Exponential backoff: 30s, 60s, 120s, 240s, ...
         cooldown_seconds = cooldown_base * (2 ** min(self.consecutive_failures - 1, 5))
         self.cooldown_until = datetime.utcnow() + timedelta(seconds=cooldown_seconds)
+        self._refresh_stats()
 
 
 class Chain(Enum):
@@ -117,16 +185,71 @@ RPC_POOLS = {
 }
 
 
+def _encode_request(method: str, params: List[Any], request_id: int = 1) -> bytes:
+    """Serialize a JSON-RPC request envelope"""
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": method,
+        "params": params
+    }, separators=(",", ":")).encode()
+
+
+# Probe requests are identical on every run; encode them once at import time
+_PROBE_BYTES = {
+    chain: _encode_request("getSlot" if chain == Chain.SOLANA else "eth_blockNumber", [])
+    for chain in Chain
+}
+
+# Encoded envelopes for parameterless methods (eth_blockNumber, getSlot, eth_chainId, ...)
+_EMPTY_PARAMS_BYTES: Dict[str, bytes] = {}
+
+
+# JSON-RPC error code providers use for "limit exceeded" / request rate limiting
+RATE_LIMIT_ERROR_CODE = -32005
+
+# Backoff after a round hit provider rate limits (HTTP 429 / -32005): min(cap, base * 2**round)
+THROTTLE_BACKOFF_BASE = 0.1
+THROTTLE_BACKOFF_CAP = 2.0
+
+# Decorrelated-jitter retry sleeps: uniform(base, previous * 3), capped
+RETRY_SLEEP_BASE = 0.5
+RETRY_SLEEP_CAP = 16.0
+
+# Floor for token-deficit waits so float rounding in the refill can't spin on ~0s sleeps
+TOKEN_WAIT_MIN = 0.001
+
+# Max requests per JSON-RPC batch; public providers commonly cap batches at 10-50
+BATCH_LIMIT = 20
+
+
+# Rate-limit markers searched in the first _BODY_SNIFF_CHARS of error bodies
+_BODY_SNIFF_CHARS = 2048
+_RATE_LIMIT_BODY_MARKERS = (
+    "rate limit", "too many requests", "error code: 1010",
+    "error code: 1020", "unauthorized", "limit exceeded",
+)
+_RATE_LIMIT_ERROR_MARKERS = ("rate limit", "too many", "429", "limit exceeded")
+
+
+# Endpoint ordering policies for call():
+# - rr: round-robin within each tier (successful endpoint moves to the back)
+# - least_latency: lowest average response time first
+# - tier: fixed tier/url order
+LB_POLICIES = ("rr", "least_latency", "tier")
+
+
 class RPCManager:
     """
     Manages RPC calls with automatic fallback and retry.
 
     Features:
     - Automatic endpoint rotation on failure
-    - Exponential backoff with jitter
+    - Decorrelated-jitter exponential backoff
     - Rate limit detection and handling
     - Health tracking per endpoint
-    - Tier-based prioritization
+    - Tier-based prioritization with round-robin or latency-based ordering
+    - Shared keep-alive connection pool across endpoints
     """
 
     def __init__(
@@ -134,7 +257,8 @@ class RPCManager:
         chain: Chain,
         max_retries: int = 3,
         timeout: int = 12,
-        probe_on_init: bool = False
+        probe_on_init: bool = False,
+        lb_policy: str = "rr"
     ):
         """
         Initialize RPC Manager.
@@ -144,44 +268,75 @@ class RPCManager:
             max_retries: Max retries per endpoint
             timeout: Request timeout in seconds
             probe_on_init: Probe endpoints on initialization
+            lb_policy: Endpoint ordering policy (see LB_POLICIES)
         """
+        if lb_policy not in LB_POLICIES:
+            raise ValueError(f"Unknown lb_policy: {lb_policy}")
+
         self.chain = chain
         self.max_retries = max_retries
         self.timeout = timeout
-
-        # Initialize endpoints
-        self.endpoints: List[RPCEndpoint] = []
-        for url, tier in RPC_POOLS.get(chain, []):
-            self.endpoints.append(RPCEndpoint(url=url, tier=tier))
+        self.lb_policy = lb_policy
+        self._rotate_lock = threading.Lock()
+
+        # One keep-alive session for every endpoint; retries are handled in call(), not urllib3
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        self._http.headers.update({"Content-Type": "application/json"})
+
+        # Initialize endpoints, sorted by tier (lower tier = higher priority)
+        self.endpoints: Deque[RPCEndpoint] = deque(sorted(
+            (RPCEndpoint(url=url, tier=tier) for url, tier in RPC_POOLS.get(chain, [])),
+            key=lambda e: (e.tier, e.url)
+        ))
 
         if not self.endpoints:
             raise ValueError(f"No RPC endpoints configured for {chain}")
 
-        # Sort by tier (lower tier = higher priority)
-        self.endpoints.sort(key=lambda e: (e.tier, e.url))
-
         if probe_on_init:
             self._probe_endpoints()
 
+    @staticmethod
+    def _tcp_preflight(url: str, timeout: float = 1.5) -> bool:
+        """Cheap TCP connect check so dead hosts fail fast before the JSON-RPC probe"""
+        parsed = urlparse(url)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        try:
+            with socket.create_connection((parsed.hostname, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    def _probe_timeout(self, endpoint: RPCEndpoint) -> float:
+        """Probe deadline derived from the endpoint's observed latency"""
+        return max(2.0, min(self.timeout, 3 * (endpoint.avg_response_time or 2.0)))
+
     def _probe_endpoints(self):
         """Probe endpoints to check availability"""
         print(f"[RPCManager] Probing {len(self.endpoints)} endpoints for {self.chain.value}...")
 
         # Lightweight probe method
-        if self.chain == Chain.SOLANA:
-            probe_payload = {"jsonrpc": "2.0", "id": 1, "method": "getSlot", "params": []}
-        else:
-            probe_payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_blockNumber", "params": []}
+        probe_payload = _PROBE_BYTES[self.chain]
 
         active_count = 0
         for endpoint in self.endpoints:
+            if not endpoint.is_available():
+                print(f"  - {endpoint.url[:50]} (cooling down)")
+                continue
+
+            if not self._tcp_preflight(endpoint.url):
+                endpoint.mark_failure()
+                print(f"  ✗ {endpoint.url[:50]} (connect failed)")
+                continue
+
             try:
                 start = time.time()
-                response = requests.post(
+                response = self._http.post(
                     endpoint.url,
-                    json=probe_payload,
-                    timeout=8,
-                    headers={"Content-Type": "application/json"}
+                    data=probe_payload,
+                    timeout=self._probe_timeout(endpoint)
                 )
                 elapsed = time.time() - start
 
@@ -206,32 +361,81 @@ class RPCManager:
             if response.status_code >= 500:
                 return True
 
-            # Check response body
+            # Check response body (markers always sit near the top of the page)
             try:
-                body = response.text.lower()
-                if any(keyword in body for keyword in [
-                    "rate limit", "too many requests", "error code: 1010",
-                    "error code: 1020", "unauthorized", "limit exceeded"
-                ]):
+                snippet = response.text[:_BODY_SNIFF_CHARS].lower()
+                if any(keyword in snippet for keyword in _RATE_LIMIT_BODY_MARKERS):
                     return True
             except:
                 pass
 
         if error is not None:
             error_str = str(error).lower()
-            if any(keyword in error_str for keyword in [
-                "rate limit", "too many", "429", "limit exceeded"
-            ]):
+            if any(keyword in error_str for keyword in _RATE_LIMIT_ERROR_MARKERS):
                 return True
 
         return False
 
-    def _retry_sleep(self, attempt: int):
-        """Sleep with exponential backoff and jitter"""
-        base = 2 ** attempt
-        jitter = random.uniform(0, 1)
-        total = min(base + jitter, 16)  # Cap at 16 seconds
+    def _throttle_sleep(self, throttle_round: int):
+        """Short exponential backoff after providers answered with rate-limit errors"""
+        time.sleep(min(THROTTLE_BACKOFF_CAP, THROTTLE_BACKOFF_BASE * 2 ** throttle_round))
+
+    def _wait_for_tokens(self) -> bool:
+        """
+        Sleep until the soonest available endpoint's bucket holds a token.
+
+        An empty local bucket is our own pacing, not an endpoint failure, so
+        callers wait out the deficit instead of spending a retry round.
+        Returns False when no endpoint is available to wait for.
+        """
+        waits = [e.seconds_until_token() for e in self.endpoints if e.is_available()]
+        if not waits:
+            return False
+        time.sleep(max(TOKEN_WAIT_MIN, min(waits)))
+        return True
+
+    @staticmethod
+    def _is_rate_limit_reply(reply: Any) -> bool:
+        """JSON-RPC reply carrying the provider rate-limit error code"""
+        if not isinstance(reply, dict):
+            return False
+        error = reply.get("error")
+        return isinstance(error, dict) and error.get("code") == RATE_LIMIT_ERROR_CODE
+
+    @staticmethod
+    def _retry_sleep(previous: float) -> float:
+        """
+        Sleep with decorrelated jitter backoff and return the sleep taken.
+
+        AWS "decorrelated jitter": each sleep is drawn from
+        [base, previous_sleep * 3], capped at 16s, so concurrent callers
+        spread out instead of retrying in synchronized waves. Callers keep
+        previous per call, starting from RETRY_SLEEP_BASE.
+        """
+        total = min(
+            RETRY_SLEEP_CAP,
+            random.uniform(RETRY_SLEEP_BASE, max(RETRY_SLEEP_BASE, previous) * 3.0)
+        )
         time.sleep(total)
+        return total
+
+    def _ordered_endpoints(self) -> List[RPCEndpoint]:
+        """Snapshot of endpoints in the order call() should try them"""
+        if self.lb_policy == "least_latency":
+            return sorted(self.endpoints, key=attrgetter("avg_response_time"))
+        if self.lb_policy == "rr":
+            # Stable sort keeps the rotated order within each tier
+            return sorted(self.endpoints, key=attrgetter("tier"))
+        return list(self.endpoints)
+
+    def _rotate_after_success(self, endpoint: RPCEndpoint):
+        """Round-robin: send the endpoint that just served a call to the back"""
+        with self._rotate_lock:
+            try:
+                self.endpoints.remove(endpoint)
+            except ValueError:
+                return
+            self.endpoints.append(endpoint)
 
     def call(
         self,
@@ -254,130 +458,298 @@ class RPCManager:
             AllRPCsFailedError: If all endpoints fail
         """
         timeout = custom_timeout or self.timeout
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params
-        }
+        if params:
+            payload = _encode_request(method, params)
+        else:
+            payload = _EMPTY_PARAMS_BYTES.get(method)
+            if payload is None:
+                payload = _EMPTY_PARAMS_BYTES[method] = _encode_request(method, [])
+
+        rate_limited_rounds = 0
+        last_sleep = RETRY_SLEEP_BASE
+        while True:
+            throttled = False
+            rate_limited = False
+
+            # Try each available endpoint
+            for endpoint in self._ordered_endpoints():
+                if not endpoint.is_available():
+                    continue
+
+                # Retry logic for this endpoint
+                for attempt in range(self.max_retries):
+                    # Shared bucket: skip endpoints other callers already saturated
+                    if not endpoint.try_take_token():
+                        throttled = True
+                        break
 
-        # Try each available endpoint
-        for endpoint in self.endpoints:
-            if not endpoint.is_available():
-                continue
+                    try:
+                        start = time.time()
+                        response = self._http.post(
+                            endpoint.url,
+                            data=payload,
+                            timeout=timeout
+                        )
+                        elapsed = time.time() - start
+
+                        # Success
+                        if response.status_code == 200:
+                            data = response.json()
+                            if "result" in data:
+                                endpoint.mark_success(elapsed)
+                                if self.lb_policy == "rr":
+                                    self._rotate_after_success(endpoint)
+                                return data["result"]
+                            elif "error" in data:
+                                if self._is_rate_limit_reply(data):
+                                    endpoint.mark_rate_limited()
+                                    rate_limited = True
+                                    print(f"[RPCManager] Rate limit on {endpoint.url[:40]}, switching endpoint")
+                                    break  # Try next endpoint
+
+                                # RPC error (not transport error)
+                                error_msg = data["error"].get("message", str(data["error"]))
+                                raise RPCError(f"RPC error: {error_msg}")
+
+                        # Rate limit or server error
+                        if self._is_rate_limit_error(response, None):
+                            if response.status_code == 429:
+                                endpoint.mark_rate_limited()
+                                rate_limited = True
+                            else:
+                                endpoint.mark_failure()
+                            print(f"[RPCManager] Rate limit on {endpoint.url[:40]}, switching endpoint")
+                            break  # Try next endpoint
+
+                        # Other HTTP error - retry
+                        if attempt < self.max_retries - 1:
+                            last_sleep = self._retry_sleep(last_sleep)
+
+                    except requests.exceptions.Timeout:
+                        if attempt < self.max_retries - 1:
+                            last_sleep = self._retry_sleep(last_sleep)
+                        else:
+                            endpoint.mark_failure()
+                            break
+
+                    except requests.exceptions.RequestException as e:
+                        if self._is_rate_limit_error(None, e):
+                            endpoint.mark_rate_limited()
+                            rate_limited = True
+                            break
+
+                        if attempt < self.max_retries - 1:
+                            last_sleep = self._retry_sleep(last_sleep)
+                        else:
+                            endpoint.mark_failure()
+                            break
+
+                    except Exception as e:
+                        print(f"[RPCManager] Unexpected error: {e}")
+                        if attempt < self.max_retries - 1:
+                            last_sleep = self._retry_sleep(last_sleep)
+                        else:
+                            endpoint.mark_failure()
+                            break
+
+            # Provider rate limits count toward giving up; empty local buckets only wait
+            if rate_limited:
+                if rate_limited_rounds == self.max_retries:
+                    break
+                self._throttle_sleep(rate_limited_rounds)
+                rate_limited_rounds += 1
+            elif not (throttled and self._wait_for_tokens()):
+                break
+
+        # All endpoints failed
+        raise AllRPCsFailedError(
+            f"All RPC endpoints failed for {self.chain.value} method {method}"
+        )
+
+    def batch_call(
+        self,
+        calls: List[tuple[str, List[Any]]],
+        custom_timeout: Optional[int] = None,
+        return_errors: bool = False
+    ) -> List[Any]:
+        """
+        Make batch RPC calls as JSON-RPC 2.0 batch requests.
+
+        Calls are sent in batches of at most BATCH_LIMIT, one POST per batch.
+
+        Args:
+            calls: List of (method, params) tuples
+            custom_timeout: Override default timeout
+            return_errors: Put an RPCError in place of each failed call's
+                result instead of raising for the whole batch
+
+        Returns:
+            List of results, in the same order as calls
+
+        Raises:
+            RPCError: If any call in a batch returns an RPC error (unless return_errors)
+            AllRPCsFailedError: If all endpoints fail
+        """
+        results = []
+        for start in range(0, len(calls), BATCH_LIMIT):
+            results.extend(self._batch_chunk(
+                calls[start:start + BATCH_LIMIT], custom_timeout, return_errors
+            ))
+        return results
+
+    def _call_or_error(
+        self,
+        method: str,
+        params: List[Any],
+        custom_timeout: Optional[int] = None
+    ) -> Any:
+        """call() that returns a per-call RPCError instead of raising it"""
+        try:
+            return self.call(method, params, custom_timeout)
+        except AllRPCsFailedError:
+            raise
+        except RPCError as e:
+            return e
+
+    def _batch_chunk(
+        self,
+        calls: List[tuple[str, List[Any]]],
+        custom_timeout: Optional[int] = None,
+        return_errors: bool = False
+    ) -> List[Any]:
+        """Send one batch; falls back to sequential call() if the endpoint rejects batching"""
+        timeout = custom_timeout or self.timeout
+        single = self._call_or_error if return_errors else self.call
+        payload = b"[" + b",".join(
+            _encode_request(method, params, i) for i, (method, params) in enumerate(calls)
+        ) + b"]"
+
+        rate_limited_rounds = 0
+        while True:
+            throttled = False
+            rate_limited = False
+
+            for endpoint in self._ordered_endpoints():
+                if not endpoint.is_available():
+                    continue
+                if not endpoint.try_take_token():
+                    throttled = True
+                    continue
 
-            # Retry logic for this endpoint
-            for attempt in range(self.max_retries):
                 try:
                     start = time.time()
-                    response = requests.post(
-                        endpoint.url,
-                        json=payload,
-                        timeout=timeout,
-                        headers={"Content-Type": "application/json"}
-                    )
+                    response = self._http.post(endpoint.url, data=payload, timeout=timeout)
                     elapsed = time.time() - start
+                except requests.exceptions.RequestException as e:
+                    if self._is_rate_limit_error(None, e):
+                        endpoint.mark_rate_limited()
+                        rate_limited = True
+                    else:
+                        endpoint.mark_failure()
+                    continue
 
-                    # Success
-                    if response.status_code == 200:
+                if response.status_code == 200:
+                    try:
                         data = response.json()
-                        if "result" in data:
-                            endpoint.mark_success(elapsed)
-                            return data["result"]
-                        elif "error" in data:
-                            # RPC error (not transport error)
-                            error_msg = data["error"].get("message", str(data["error"]))
-                            raise RPCError(f"RPC error: {error_msg}")
-
-                    # Rate limit or server error
-                    if self._is_rate_limit_error(response, None):
-                        endpoint.mark_failure()
+                    except ValueError:
+                        data = None
+
+                    if isinstance(data, list) and any(map(self._is_rate_limit_reply, data)):
+                        endpoint.mark_rate_limited()
+                        rate_limited = True
                         print(f"[RPCManager] Rate limit on {endpoint.url[:40]}, switching endpoint")
-                        break  # Try next endpoint
+                        continue
 
-                    # Other HTTP error - retry
-                    if attempt < self.max_retries - 1:
-                        self._retry_sleep(attempt)
+                    if isinstance(data, list):
+                        endpoint.mark_success(elapsed)
+                        if self.lb_policy == "rr":
+                            self._rotate_after_success(endpoint)
+                        return self._demux_batch(calls, data, return_errors)
 
-                except requests.exceptions.Timeout:
-                    if attempt < self.max_retries - 1:
-                        self._retry_sleep(attempt)
-                    else:
-                        endpoint.mark_failure()
-                        break
+                    # Batching unsupported: the endpoint answered with a single error object
+                    return [single(method, params, custom_timeout) for method, params in calls]
 
-                except requests.exceptions.RequestException as e:
-                    if self._is_rate_limit_error(None, e):
-                        endpoint.mark_failure()
-                        break
+                if response.status_code in (400, 413):
+                    # Batch rejected or too large for this provider
+                    return [single(method, params, custom_timeout) for method, params in calls]
 
-                    if attempt < self.max_retries - 1:
-                        self._retry_sleep(attempt)
-                    else:
-                        endpoint.mark_failure()
-                        break
+                if response.status_code == 429:
+                    endpoint.mark_rate_limited()
+                    rate_limited = True
+                else:
+                    endpoint.mark_failure()
+                if self._is_rate_limit_error(response, None):
+                    print(f"[RPCManager] Rate limit on {endpoint.url[:40]}, switching endpoint")
 
-                except Exception as e:
-                    print(f"[RPCManager] Unexpected error: {e}")
-                    if attempt < self.max_retries - 1:
-                        self._retry_sleep(attempt)
-                    else:
-                        endpoint.mark_failure()
-                        break
+            if rate_limited:
+                if rate_limited_rounds == self.max_retries:
+                    break
+                self._throttle_sleep(rate_limited_rounds)
+                rate_limited_rounds += 1
+            elif not (throttled and self._wait_for_tokens()):
+                break
 
-        # All endpoints failed
         raise AllRPCsFailedError(
-            f"All RPC endpoints failed for {self.chain.value} method {method}"
+            f"All RPC endpoints failed for {self.chain.value} batch of {len(calls)} calls"
         )
 
-    def batch_call(
-        self,
-        calls: List[tuple[str, List[Any]]]
+    @staticmethod
+    def _demux_batch(
+        calls: List[tuple[str, List[Any]]],
+        data: List[Any],
+        return_errors: bool = False
     ) -> List[Any]:
         """
-        Make batch RPC calls.
-
-        Args:
-            calls: List of (method, params) tuples
+        Match batch replies back to calls by id (servers may reply in any order).
 
-        Returns:
-            List of results
+        A failed item raises RPCError, or with return_errors the RPCError
+        takes that item's place in the results.
         """
-        # Simple sequential implementation
-        # TODO: Implement true JSON-RPC batch requests
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+
         results = []
-        for method, params in calls:
-            result = self.call(method, params)
-            results.append(result)
+        for i, (method, _) in enumerate(calls):
+            item = by_id.get(i)
+            if item is None:
+                failure = RPCError(f"RPC error: missing batch reply for {method}")
+            elif "error" in item:
+                error = item["error"]
+                error_msg = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                failure = RPCError(f"RPC error: {error_msg}")
+            else:
+                results.append(item.get("result"))
+                continue
+
+            if not return_errors:
+                raise failure
+            results.append(failure)
         return results
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get endpoint statistics"""
-        stats = {
+        """
+        Get endpoint statistics.
+
+        Per-endpoint entries are the endpoints' live stats dicts (kept up to
+        date by mark_success/mark_failure), listed in the current endpoint
+        order; copy them if a snapshot is needed.
+        """
+        # Same lock as _rotate_after_success, so the list matches the deque order
+        with self._rotate_lock:
+            endpoints = list(self.endpoints)
+
+        available = 0
+        for endpoint in endpoints:
+            is_available = endpoint.is_available()
+            endpoint._stats_dict["available"] = is_available
+            available += is_available
+
+        return {
             "chain": self.chain.value,
-            "total_endpoints": len(self.endpoints),
-            "available_endpoints": sum(1 for e in self.endpoints if e.is_available()),
-            "endpoints": []
+            "total_endpoints": len(endpoints),
+            "available_endpoints": available,
+            "endpoints": [endpoint._stats_dict for endpoint in endpoints],
         }
 
-        for endpoint in self.endpoints:
-            stats["endpoints"].append({
-                "url": endpoint.url,
-                "tier": endpoint.tier,
-                "available": endpoint.is_available(),
-                "consecutive_failures": endpoint.consecutive_failures,
-                "total_requests": endpoint.total_requests,
-                "total_failures": endpoint.total_failures,
-                "success_rate": (
-                    (endpoint.total_requests - endpoint.total_failures) / endpoint.total_requests
-                    if endpoint.total_requests > 0 else 0
-                ),
-                "avg_response_time": endpoint.avg_response_time,
-                "cooldown_until": endpoint.cooldown_until.isoformat() if endpoint.cooldown_until else None
-            })
-
-        return stats
-
 
 # Convenience functions
 def create_rpc_manager(chain_name: str, **kwargs) -> RPCManager:
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import argparse
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import cloudscraper
@@ -71,6 +73,9 @@ CF_BLOCK_PATTERNS = (
     "just a moment",
 )
 
+# Block pages put their markers in the first tags; no need to scan (or copy) more
+BODY_SNIFF_CHARS = 2048
+
 
 def build_payload(chain: str) -> dict[str, Any]:
     if chain == "solana":
@@ -79,9 +84,9 @@ def build_payload(chain: str) -> dict[str, Any]:
 
 
 def classify_response(status_code: int, text: str, body: Any) -> str:
-    lowered = text.lower()
     if status_code in (403, 429):
         return "blocked"
+    lowered = text[:BODY_SNIFF_CHARS].lower()
     if any(pattern in lowered for pattern in CF_BLOCK_PATTERNS):
         return "blocked"
     if isinstance(body, dict) and "result" in body:
@@ -150,6 +155,61 @@ def probe_once(
     }
 
 
+_thread_state = threading.local()
+
+
+def get_scraper() -> cloudscraper.CloudScraper:
+    # CloudScraper mutates its cookie jar per host, so each worker keeps its own.
+    scraper = getattr(_thread_state, "scraper", None)
+    if scraper is None:
+        scraper = cloudscraper.create_scraper(
+            browser={"browser": "chrome", "platform": "windows", "mobile": False}
+        )
+        _thread_state.scraper = scraper
+    return scraper
+
+
+def probe_endpoint(
+    endpoint: str,
+    payload: dict[str, Any],
+    tries: int,
+    timeout_seconds: int,
+    sleep_seconds: float,
+) -> dict[str, Any]:
+    scraper = get_scraper()
+    attempts: list[dict[str, Any]] = []
+    for _ in range(tries):
+        attempts.append(probe_once(scraper, endpoint, payload, timeout_seconds))
+        time.sleep(sleep_seconds)
+
+    return {
+        "endpoint": endpoint,
+        "attempts": attempts,
+        **summarize_attempts(attempts),
+    }
+
+
+def probe_endpoints(
+    endpoints: list[str],
+    payload: dict[str, Any],
+    tries: int,
+    timeout_seconds: int,
+    sleep_seconds: float,
+    workers: int = 8,
+) -> list[dict[str, Any]]:
+    # Tries stay sequential per endpoint; endpoints run in parallel.
+    # executor.map yields in input order, so output order is unchanged.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(
+            executor.map(
+                lambda endpoint: probe_endpoint(
+                    endpoint, payload, tries, timeout_seconds, sleep_seconds
+                ),
+                endpoints,
+            )
+        )
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     _ = parser.add_argument(
@@ -158,6 +218,7 @@ def parse_args() -> argparse.Namespace:
     _ = parser.add_argument("--tries", type=int, default=2)
     _ = parser.add_argument("--timeout", type=int, default=10)
     _ = parser.add_argument("--sleep", type=float, default=0.2)
+    _ = parser.add_argument("--workers", type=int, default=8)
     _ = parser.add_argument(
         "--endpoints",
         default="",
@@ -185,26 +246,15 @@ def main() -> int:
         endpoints = endpoint_map[chain]
 
     payload = build_payload(chain)
-    scraper = cloudscraper.create_scraper(
-        browser={"browser": "chrome", "platform": "windows", "mobile": False}
+    results = probe_endpoints(
+        endpoints,
+        payload,
+        tries=args.tries,
+        timeout_seconds=args.timeout,
+        sleep_seconds=args.sleep,
+        workers=args.workers,
     )
 
-    results: list[dict[str, Any]] = []
-    for endpoint in endpoints:
-        attempts: list[dict[str, Any]] = []
-        for _ in range(args.tries):
-            attempts.append(probe_once(scraper, endpoint, payload, args.timeout))
-            time.sleep(args.sleep)
-
-        summary = summarize_attempts(attempts)
-        results.append(
-            {
-                "endpoint": endpoint,
-                "attempts": attempts,
-                **summary,
-            }
-        )
-
     active = [item["endpoint"] for item in results if item["final_status"] == "active"]
     blocked = [
         item["endpoint"] for item in results if item["final_status"] == "blocked"
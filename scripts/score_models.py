@@ -2,10 +2,10 @@ import argparse
 import json
 import math
 from pathlib import Path
-from typing import Mapping
+from typing import Mapping, Sequence, TextIO
 
 
-REQUIRED_FIELDS = {
+_REQUIRED_TUPLE = (
     "co_funder",
     "co_time",
     "co_amount",
@@ -19,7 +19,8 @@ REQUIRED_FIELDS = {
     "deterministic_strength",
     "cross_source_agreement",
     "temporal_stability",
-}
+)
+REQUIRED_FIELDS = frozenset(_REQUIRED_TUPLE)
 
 
 def _read_float(payload: Mapping[str, float | int], key: str) -> float:
@@ -86,7 +87,7 @@ def classify_link_confidence(score: float) -> str:
 
 
 def build_scores(payload: Mapping[str, float | int]) -> dict[str, float | str]:
-    missing = REQUIRED_FIELDS.difference(payload.keys())
+    missing = [key for key in _REQUIRED_TUPLE if key not in payload]
     if missing:
         joined = ", ".join(sorted(missing))
         raise ValueError(f"missing required fields: {joined}")
@@ -105,14 +106,14 @@ def build_scores(payload: Mapping[str, float | int]) -> dict[str, float | str]:
     }
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     _ = parser.add_argument("--input", required=True, type=Path)
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: Sequence[str] | None = None, stdout: TextIO | None = None) -> int:
+    args = parse_args(argv)
     with args.input.open("r", encoding="utf-8") as f:
         payload_raw = json.load(f)
     if not isinstance(payload_raw, dict):
@@ -127,7 +128,7 @@ def main() -> int:
         payload[key] = value
 
     result = build_scores(payload)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(json.dumps(result, ensure_ascii=False, indent=2), file=stdout)
     return 0
 
 
@@ -5,15 +5,30 @@ Solscan Client - 优先使用逆向的 $200/月 API，降级到公共 RPC
 基于 https://github.com/paoloanzn/free-solscan-api 逆向工程
 """
 
+import functools
+import itertools
 import json
+import random
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson 可选：编解码更快且直接返回 bytes；未安装时退回标准库 json
 try:
-    import free_solscan_api
-    SOLSCAN_AVAILABLE = True
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
 except ImportError:
-    SOLSCAN_AVAILABLE = False
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _loads = json.loads
 
 # Fallback: 公共 RPC 池
 SOLANA_RPCS = [
@@ -23,18 +38,207 @@ SOLANA_RPCS = [
     "https://solana.drpc.org",
 ]
 
+# 预编码的 JSON-RPC 信封，只需拼入 id / method / params
+_ENVELOPE = b'{"jsonrpc":"2.0","id":%d,"method":%b,"params":%b}'
+# 单调递增的请求 id（批量请求按 id 还原结果）
+_request_ids = itertools.count(1)
+
+# 每个端点的请求速率上限（次/秒），未列出的端点使用 DEFAULT_RPC_RATE
+RPC_RATE_LIMITS = {
+    "https://api.mainnet-beta.solana.com": 10.0,
+    "https://api.mainnet.solana.com": 10.0,
+}
+DEFAULT_RPC_RATE = 5.0
+
+# 并发 RPC 的最大线程数（I/O 密集，线程足够）
+RPC_MAX_WORKERS = 8
+
+# 竞速调用共享线程池的大小：同时在途的竞速请求（含落败者）不超过此数
+RPC_RACE_WORKERS = 8
+
+# 单个 JSON-RPC 批量请求的最大调用数（公共节点超过约 50 个容易被拒）
+RPC_BATCH_LIMIT = 50
+
+_TX_OPTS = {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}
+
+
+class _TTLCache:
+    """有界 LRU 内存缓存，条目可选 TTL（ttl=None 表示永不过期）"""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class _RateLimiter:
+    """阻塞式令牌桶限速器；收到 429 时减半速率并按 Retry-After 暂停，成功后逐步恢复（AIMD）"""
+
+    min_rate = 0.5
+    # 每次成功响应恢复的速率（次/秒），直至配置的上限
+    recovery_step = 0.5
+    # 最短等待，防止浮点舍入导致以近似 0 秒的 sleep 空转
+    min_wait = 0.001
+
+    def __init__(self, rate: float):
+        self.max_rate = rate
+        self.rate = rate
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # 容量至少一个令牌，否则速率降到 1 次/秒以下后永远攒不满
+                capacity = max(1.0, self.rate)
+                self._tokens = min(capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                delay = self._paused_until - now
+                if delay <= 0:
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    delay = (1.0 - self._tokens) / self.rate
+            time.sleep(max(self.min_wait, delay))
+
+    def throttle(self, retry_after: Optional[float] = None):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def recover(self):
+        """成功响应后加性恢复速率，避免一次 429 永久降速"""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+
+class _JitterRetry(Retry):
+    """full jitter 指数退避，避免并发请求同步重试；带 Retry-After 的响应由 urllib3 优先按头部等待"""
+
+    backoff_base = 0.25
+    backoff_cap = 8.0
+
+    def get_backoff_time(self) -> float:
+        if not self.history:
+            return 0.0
+        attempt = len(self.history) - 1
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After（秒数或 HTTP 日期）"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.cache
+def _encode_method(method: str) -> bytes:
+    return _dumps(method)
+
+
+@functools.cache
+def _import_solscan():
+    """按需导入 free_solscan_api，只在首次使用时付出导入开销；未安装时返回 None"""
+    try:
+        import free_solscan_api
+    except ImportError:
+        return None
+    return free_solscan_api
+
+
+def _memoize(cache_attr: str):
+    """按 (方法名, 参数) 缓存非空结果到实例上的 _TTLCache"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, cache_attr)
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            value = cache.get(key)
+            if value is None:
+                value = fn(self, *args, **kwargs)
+                if value is not None:
+                    cache.set(key, value)
+            return value
+        return wrapper
+    return decorator
+
 
 class SolscanClient:
     """Solana 数据客户端，优先 Solscan 逆向 API，降级公共 RPC"""
 
     def __init__(self, prefer_solscan: bool = True):
-        self.prefer_solscan = prefer_solscan and SOLSCAN_AVAILABLE
+        self.prefer_solscan = prefer_solscan and _import_solscan() is not None
         self._router = None
         self._rpc_index = 0
         self._rpc_fails: Dict[str, int] = {}
+        self._session = self._create_session()
+        self._limiters = {
+            rpc: _RateLimiter(RPC_RATE_LIMITS.get(rpc, DEFAULT_RPC_RATE)) for rpc in SOLANA_RPCS
+        }
+        # 客户端级共享线程池：落败的竞速请求只能占用其中的线程，数量有上限
+        self._race_pool = ThreadPoolExecutor(
+            max_workers=RPC_RACE_WORKERS, thread_name_prefix="solana-race"
+        )
+
+        # 已确认交易不可变，无需过期；账户与代币数据会变化，设置短 TTL
+        self._cache_tx = _TTLCache(maxsize=10_000)
+        self._cache_info = _TTLCache(maxsize=5000, ttl=30)
+        self._cache_mint = _TTLCache(maxsize=2000, ttl=300)
 
         if self.prefer_solscan:
-            self._router = free_solscan_api.Router(free_solscan_api.solscan_endpoints)
+            solscan = _import_solscan()
+            self._router = solscan.Router(solscan.solscan_endpoints)
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """持久连接池（keep-alive），并由 Retry 负责 429/5xx 的重试与退避"""
+        retry = _JitterRetry(
+            total=3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),  # JSON-RPC 读请求是幂等的
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=64, max_retries=retry))
+        session.headers.update({"Content-Type": "application/json"})
+        return session
 
     @property
     def source(self) -> str:
@@ -42,6 +246,7 @@ class SolscanClient:
 
     # ========== Solscan API 方法 ==========
 
+    @_memoize("_cache_tx")
     def transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """获取交易详情"""
         if self.prefer_solscan:
@@ -51,6 +256,10 @@ class SolscanClient:
                 print(f"[Solscan] transaction failed: {e}, falling back to RPC")
         return self._rpc_get_transaction(tx_hash)
 
+    def transactions_bulk(self, tx_hashes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """批量获取交易详情（公共 RPC JSON-RPC 批量请求，结果顺序与输入一致）"""
+        return self._rpc_batch([("getTransaction", [h, _TX_OPTS]) for h in tx_hashes])
+
     def transactions(self, address: str, page: int = 1, page_size: int = 40) -> Optional[Dict[str, Any]]:
         """获取地址交易列表"""
         if self.prefer_solscan:
@@ -60,6 +269,7 @@ class SolscanClient:
                 print(f"[Solscan] transactions failed: {e}, falling back to RPC")
         return self._rpc_get_signatures(address, limit=page_size)
 
+    @_memoize("_cache_info")
     def account_info(self, address: str) -> Optional[Dict[str, Any]]:
         """获取账户信息"""
         if self.prefer_solscan:
@@ -153,6 +363,7 @@ class SolscanClient:
                 print(f"[Solscan] top_address_transfers failed: {e}")
         return None
 
+    @_memoize("_cache_mint")
     def token_data(self, mint: str = "So11111111111111111111111111111111111111112") -> Optional[Dict[str, Any]]:
         """获取代币数据"""
         if self.prefer_solscan:
@@ -175,50 +386,155 @@ class SolscanClient:
         self._rpc_fails.clear()
         return SOLANA_RPCS[0]
 
+    def _send(self, rpc: str, payload: bytes) -> requests.Response:
+        """按端点限速后发送；最终仍为 429 时降低该端点速率，成功时逐步恢复"""
+        limiter = self._limiters[rpc]
+        limiter.acquire()
+        resp = self._session.post(rpc, data=payload, timeout=12)
+        if resp.status_code == 429:
+            limiter.throttle(_parse_retry_after(resp.headers.get("Retry-After")))
+        elif resp.status_code < 400:
+            limiter.recover()
+        return resp
+
+    def _rpc_post(self, rpc: str, payload: bytes) -> Any:
+        """向单个端点发送请求并返回响应体；传输失败抛出异常"""
+        resp = self._send(rpc, payload)
+        resp.raise_for_status()
+        return _loads(resp.content)
+
+    @staticmethod
+    def _encode_call(method: str, params: list, call_id: Optional[int] = None) -> bytes:
+        if call_id is None:
+            call_id = next(_request_ids)
+        return _ENVELOPE % (call_id, _encode_method(method), _dumps(params))
+
     def _rpc_call(self, method: str, params: list) -> Optional[Dict[str, Any]]:
-        """执行 RPC 调用"""
-        import urllib.request
+        """执行 RPC 调用（单端点的重试退避由会话处理，失败后换下一个端点）"""
+        payload = self._encode_call(method, params)
 
-        rpc = self._get_rpc()
-        payload = json.dumps({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params
-        }).encode()
-
-        for attempt in range(3):
+        for _ in range(3):
+            rpc = self._get_rpc()
             try:
-                req = urllib.request.Request(
-                    rpc,
-                    data=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                with urllib.request.urlopen(req, timeout=12) as resp:
-                    result = json.loads(resp.read().decode())
+                result = self._rpc_post(rpc, payload)
+                if "result" in result:
+                    self._rpc_fails[rpc] = 0
+                    return result["result"]
+                if "error" in result:
+                    print(f"[RPC] {method} error: {result['error']}")
+                    return None
+            except Exception:
+                self._rpc_fails[rpc] = self._rpc_fails.get(rpc, 0) + 1
+                self._rpc_index = (self._rpc_index + 1) % len(SOLANA_RPCS)
+        return None
+
+    def _race_post(self, rpc: str, payload: bytes, settled: threading.Event) -> Optional[Any]:
+        """竞速中的单个请求；结果已决出后不再发送，也不消耗该端点的令牌"""
+        if settled.is_set():
+            return None
+        return self._rpc_post(rpc, payload)
+
+    def _rpc_call_raced(self, method: str, params: list) -> Optional[Dict[str, Any]]:
+        """只读幂等调用：同时请求所有可用端点，采用最先成功的结果
+
+        延迟取决于最快的端点而不是逐个重试的总和。请求在客户端共享的线程池中
+        执行：决出结果后，尚未发出的请求被取消或直接跳过，已发出的落败请求
+        在后台完成并被丢弃，其数量受 RPC_RACE_WORKERS 限制。
+        """
+        payload = self._encode_call(method, params)
+        rpcs = [rpc for rpc in SOLANA_RPCS if self._rpc_fails.get(rpc, 0) < 3]
+        if not rpcs:
+            # 全部失败，重置
+            self._rpc_fails.clear()
+            rpcs = list(SOLANA_RPCS)
+
+        settled = threading.Event()
+        futures = {
+            self._race_pool.submit(self._race_post, rpc, payload, settled): rpc for rpc in rpcs
+        }
+        last_error = None
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rpc = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception:
+                        self._rpc_fails[rpc] = self._rpc_fails.get(rpc, 0) + 1
+                        continue
+                    if not isinstance(result, dict):
+                        # 非对象响应（数组、字符串等）只算该端点失败，不中断竞速
+                        self._rpc_fails[rpc] = self._rpc_fails.get(rpc, 0) + 1
+                        last_error = f"unexpected response from {rpc}"
+                        continue
                     if "result" in result:
                         self._rpc_fails[rpc] = 0
                         return result["result"]
-                    if "error" in result:
-                        print(f"[RPC] {method} error: {result['error']}")
-                        return None
-            except Exception as e:
-                self._rpc_fails[rpc] = self._rpc_fails.get(rpc, 0) + 1
-                if attempt < 2:
-                    time.sleep(1 << attempt)
-                    self._rpc_index = (self._rpc_index + 1) % len(SOLANA_RPCS)
-                    rpc = self._get_rpc()
+                    last_error = result.get("error")
+        finally:
+            settled.set()
+            for future in futures:
+                future.cancel()
+
+        if last_error is not None:
+            print(f"[RPC] {method} error: {last_error}")
         return None
 
+    def _rpc_call_many(self, calls: List[Tuple[str, list]]) -> List[Optional[Any]]:
+        """并发执行多个 RPC 调用，隐藏逐个往返的延迟；结果顺序与 calls 一致"""
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(RPC_MAX_WORKERS, len(calls))) as pool:
+            return list(pool.map(lambda call: self._rpc_call(*call), calls))
+
+    def _rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Optional[Any]]:
+        """JSON-RPC 2.0 批量请求：每 RPC_BATCH_LIMIT 个调用合并为一次 POST"""
+        results: List[Optional[Any]] = []
+        for start in range(0, len(calls), RPC_BATCH_LIMIT):
+            results.extend(self._rpc_batch_chunk(calls[start:start + RPC_BATCH_LIMIT]))
+        return results
+
+    def _rpc_batch_chunk(self, calls: List[Tuple[str, list]]) -> List[Optional[Any]]:
+        """发送单个批量请求并按 id 还原结果顺序；端点不支持批量时退回逐个并发调用"""
+        rpc = self._get_rpc()
+        payload = b"[" + b",".join(
+            self._encode_call(method, params, i) for i, (method, params) in enumerate(calls)
+        ) + b"]"
+
+        body = None
+        try:
+            resp = self._send(rpc, payload)
+            # 400/413: 端点不支持批量或批量过大，直接退回逐个调用，不计入失败
+            if resp.status_code not in (400, 413):
+                resp.raise_for_status()
+                body = _loads(resp.content)
+        except Exception:
+            self._rpc_fails[rpc] = self._rpc_fails.get(rpc, 0) + 1
+
+        if not isinstance(body, list):
+            return self._rpc_call_many(calls)
+
+        self._rpc_fails[rpc] = 0
+        by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        results = []
+        for i, (method, _) in enumerate(calls):
+            item = by_id.get(i, {})
+            if "error" in item:
+                print(f"[RPC] {method} error: {item['error']}")
+            results.append(item.get("result"))
+        return results
+
     def _rpc_get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
-        return self._rpc_call("getTransaction", [tx_hash, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}])
+        return self._rpc_call_raced("getTransaction", [tx_hash, _TX_OPTS])
 
     def _rpc_get_signatures(self, address: str, limit: int = 50) -> Optional[Dict[str, Any]]:
-        sigs = self._rpc_call("getSignaturesForAddress", [address, {"limit": limit}])
+        sigs = self._rpc_call_raced("getSignaturesForAddress", [address, {"limit": limit}])
         return {"signatures": sigs} if sigs else None
 
     def _rpc_get_account_info(self, address: str) -> Optional[Dict[str, Any]]:
-        return self._rpc_call("getAccountInfo", [address, {"encoding": "jsonParsed"}])
+        return self._rpc_call_raced("getAccountInfo", [address, {"encoding": "jsonParsed"}])
 
     def _rpc_get_token_supply(self, mint: str) -> Optional[Dict[str, Any]]:
         supply = self._rpc_call("getTokenSupply", [mint])
@@ -252,7 +568,7 @@ if __name__ == "__main__":
 
     client = SolscanClient(prefer_solscan=not args.no_solscan)
     print(f"[Source] {client.source}")
-    print(f"[Solscan Available] {SOLSCAN_AVAILABLE}")
+    print(f"[Solscan Available] {_import_solscan() is not None}")
 
     result = None
 
@@ -8,9 +8,23 @@ Detects:
 - Large holdings with minimal activity
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter, itemgetter
+
+import numpy as np
+
+
+_RISK_SCORE = attrgetter("risk_score")
+
+# Holder dict -> (address, balance, balance_pct, tx_count, bnb_balance)
+_HOLDER_RECORD = itemgetter("address", "balance", "balance_pct", "tx_count", "bnb_balance")
 
 
 class SuspicionLevel(Enum):
@@ -21,7 +35,15 @@ class SuspicionLevel(Enum):
     LOW = "low"
 
 
-@dataclass
+_SEVERITY_ICON: Dict[SuspicionLevel, str] = {
+    SuspicionLevel.CRITICAL: "🔴",
+    SuspicionLevel.HIGH: "🟠",
+    SuspicionLevel.MEDIUM: "🟡",
+    SuspicionLevel.LOW: "🟢"
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SuspiciousFlag:
     """Individual suspicion flag"""
     type: str
@@ -30,7 +52,7 @@ class SuspiciousFlag:
     score: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SuspiciousHolder:
     """Suspicious holder with flags and risk score"""
     address: str
@@ -38,11 +60,58 @@ class SuspiciousHolder:
     balance_pct: float
     tx_count: int
     bnb_balance: float
-    flags: List[SuspiciousFlag]
+    flags: Tuple[SuspiciousFlag, ...]
     risk_score: int
     recommendation: str
 
 
+# (type, severity, score, description template); bit i of a holder's flag
+# mask corresponds to entry i, see SuspiciousDetector._rule_bits
+_FLAG_RULES = (
+    # Flag 1: Zero transactions with large holding
+    ("ZERO_TX_LARGE_HOLDING", SuspicionLevel.CRITICAL, 40,
+     "Zero transactions but holds {pct:.2f}% of supply"),
+    # Flag 2: Single transaction, never sold
+    ("SINGLE_TX_LARGE_HOLDING", SuspicionLevel.HIGH, 30,
+     "Only 1 transaction but holds {pct:.2f}% of supply"),
+    # Flag 3: Insufficient gas to transact
+    ("INSUFFICIENT_GAS", SuspicionLevel.MEDIUM, 20,
+     "Only {bnb:.6f} BNB (< {min_gas} threshold)"),
+    # Flag 4: Large holding with very low activity
+    ("LARGE_HOLDING_LOW_ACTIVITY", SuspicionLevel.HIGH, 25,
+     "Holds {pct:.2f}% but only {txs} transactions"),
+    # Flag 5: Received tokens but never moved them
+    ("RECEIVED_NEVER_MOVED", SuspicionLevel.HIGH, 30,
+     "Received tokens via internal tx, never initiated any transaction"),
+    # Flag 6: Cannot sell without external funding
+    ("LOCKED_BY_GAS", SuspicionLevel.CRITICAL, 35,
+     "Effectively locked: {bnb:.6f} BNB insufficient to move {pct:.2f}%"),
+)
+
+# Risk score for every possible flag mask
+_SCORE_TABLE = [
+    sum(rule[2] for i, rule in enumerate(_FLAG_RULES) if mask >> i & 1)
+    for mask in range(1 << len(_FLAG_RULES))
+]
+
+
+def _render_holder(index: int, holder: SuspiciousHolder) -> str:
+    """Render one report entry (header block and its flags) as a single string"""
+    flag_lines = "".join([
+        f"\n   {_SEVERITY_ICON[flag.severity]} [{flag.type}] {flag.description}"
+        for flag in holder.flags
+    ])
+    return (
+        f"\n\n{index}. {holder.address[:10]}...{holder.address[-8:]}"
+        f"\n   Balance: {holder.balance:,.0f} ({holder.balance_pct:.2f}%)"
+        f"\n   Tx Count: {holder.tx_count}"
+        f"\n   BNB: {holder.bnb_balance:.6f}"
+        f"\n   Risk Score: {holder.risk_score}/100"
+        f"\n   Recommendation: {holder.recommendation}"
+        f"\n\n   Flags:{flag_lines}"
+    )
+
+
 class SuspiciousDetector:
     """
     Detect suspicious holder patterns.
@@ -52,6 +121,14 @@ class SuspiciousDetector:
     - Holder3: 1 tx, 1.63% holding, 0.002 BNB
     """
 
+    # Holder count above which detect() fans out across CPU cores
+    PARALLEL_THRESHOLD = 50_000
+
+    # Risk score thresholds for recommendations and the report summary
+    CRITICAL_SCORE = 70
+    HIGH_SCORE = 50
+    MEDIUM_SCORE = 30
+
     def __init__(
         self,
         min_suspicious_pct: float = 1.0,
@@ -69,7 +146,8 @@ class SuspiciousDetector:
 
     def detect(
         self,
-        holders: List[Dict[str, Any]]
+        holders: List[Dict[str, Any]],
+        top_k: Optional[int] = None
     ) -> List[SuspiciousHolder]:
         """
         Detect suspicious holders.
@@ -81,120 +159,145 @@ class SuspiciousDetector:
                 - balance_pct: float
                 - tx_count: int
                 - bnb_balance: float
+            top_k: Only return the K riskiest holders (default: all)
 
         Returns:
             List of suspicious holders sorted by risk score
         """
-        suspicious = []
+        workers = os.cpu_count() or 1
+        if len(holders) > self.PARALLEL_THRESHOLD and workers > 1:
+            return self._detect_parallel(holders, top_k, workers)
+        return self._detect_chunk(holders, top_k)
+
+    def _detect_parallel(
+        self,
+        holders: List[Dict[str, Any]],
+        top_k: Optional[int],
+        workers: int
+    ) -> List[SuspiciousHolder]:
+        """Shard holders across processes and merge the per-shard rankings"""
+        size = -(-len(holders) // workers)
+        chunks = [holders[i:i + size] for i in range(0, len(holders), size)]
 
-        for holder in holders:
-            flags = self._analyze_holder(holder)
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            parts = list(executor.map(self._detect_chunk, chunks, repeat(top_k)))
+
+        # Shards are already sorted; merge keeps input order for equal scores
+        merged = heapq.merge(*parts, key=_RISK_SCORE, reverse=True)
+        return list(islice(merged, top_k))
+
+    def _detect_chunk(
+        self,
+        holders: List[Dict[str, Any]],
+        top_k: Optional[int] = None
+    ) -> List[SuspiciousHolder]:
+        """Single-process detection over one list of holders"""
+        # Read each dict once; everything below works on positional tuples
+        records = list(map(_HOLDER_RECORD, holders))
+        masks = self._flag_masks(records)
 
-            if not flags:
-                continue
+        suspicious = []
 
-            # Calculate total risk score
-            risk_score = sum(f.score for f in flags)
+        # Only materialize flags for holders that tripped at least one rule
+        for i in np.flatnonzero(masks):
+            address, balance, balance_pct, tx_count, bnb_balance = records[i]
+            mask = int(masks[i])
+            flags = self._build_flags(mask, balance_pct, tx_count, bnb_balance)
+            risk_score = _SCORE_TABLE[mask]
 
             # Generate recommendation
             recommendation = self._generate_recommendation(flags, risk_score)
 
             suspicious.append(SuspiciousHolder(
-                address=holder['address'],
-                balance=holder['balance'],
-                balance_pct=holder['balance_pct'],
-                tx_count=holder['tx_count'],
-                bnb_balance=holder['bnb_balance'],
+                address=address,
+                balance=balance,
+                balance_pct=balance_pct,
+                tx_count=tx_count,
+                bnb_balance=bnb_balance,
                 flags=flags,
                 risk_score=risk_score,
                 recommendation=recommendation
             ))
 
         # Sort by risk score (highest first)
-        suspicious.sort(key=lambda x: x.risk_score, reverse=True)
-
-        return suspicious
-
-    def _analyze_holder(
-        self,
-        holder: Dict[str, Any]
-    ) -> List[SuspiciousFlag]:
-        """Analyze single holder for suspicious patterns"""
-        flags = []
-
-        address = holder['address']
-        balance_pct = holder['balance_pct']
-        tx_count = holder['tx_count']
-        bnb_balance = holder['bnb_balance']
-
-        # Flag 1: Zero transactions with large holding
-        if tx_count == 0 and balance_pct >= self.min_suspicious_pct:
-            flags.append(SuspiciousFlag(
-                type="ZERO_TX_LARGE_HOLDING",
-                description=f"Zero transactions but holds {balance_pct:.2f}% of supply",
-                severity=SuspicionLevel.CRITICAL,
-                score=40
-            ))
-
-        # Flag 2: Single transaction, never sold
-        if tx_count == 1 and balance_pct >= self.min_suspicious_pct:
-            flags.append(SuspiciousFlag(
-                type="SINGLE_TX_LARGE_HOLDING",
-                description=f"Only 1 transaction but holds {balance_pct:.2f}% of supply",
-                severity=SuspicionLevel.HIGH,
-                score=30
-            ))
-
-        # Flag 3: Insufficient gas to transact
-        if bnb_balance < self.min_gas_bnb:
-            flags.append(SuspiciousFlag(
-                type="INSUFFICIENT_GAS",
-                description=f"Only {bnb_balance:.6f} BNB (< {self.min_gas_bnb} threshold)",
-                severity=SuspicionLevel.MEDIUM,
-                score=20
-            ))
+        if top_k is not None:
+            return heapq.nlargest(top_k, suspicious, key=_RISK_SCORE)
 
-        # Flag 4: Large holding with very low activity
-        if balance_pct >= 1.5 and tx_count < 5 and tx_count > 0:
-            flags.append(SuspiciousFlag(
-                type="LARGE_HOLDING_LOW_ACTIVITY",
-                description=f"Holds {balance_pct:.2f}% but only {tx_count} transactions",
-                severity=SuspicionLevel.HIGH,
-                score=25
-            ))
+        suspicious.sort(key=_RISK_SCORE, reverse=True)
 
-        # Flag 5: Received tokens but never moved them
-        if tx_count == 0 and balance_pct >= 0.5:
-            flags.append(SuspiciousFlag(
-                type="RECEIVED_NEVER_MOVED",
-                description="Received tokens via internal tx, never initiated any transaction",
-                severity=SuspicionLevel.HIGH,
-                score=30
-            ))
+        return suspicious
 
-        # Flag 6: Cannot sell without external funding
-        if bnb_balance < 0.001 and balance_pct >= 1.0:
-            flags.append(SuspiciousFlag(
-                type="LOCKED_BY_GAS",
-                description=f"Effectively locked: {bnb_balance:.6f} BNB insufficient to move {balance_pct:.2f}%",
-                severity=SuspicionLevel.CRITICAL,
-                score=35
-            ))
+    def _flag_masks(self, records: List[Tuple]) -> np.ndarray:
+        """Evaluate every rule over all holder records at once, returning per-holder bitmasks"""
+        n = len(records)
+        pcts = np.fromiter(map(itemgetter(2), records), dtype=np.float64, count=n)
+        txs = np.fromiter(map(itemgetter(3), records), dtype=np.int64, count=n)
+        bnbs = np.fromiter(map(itemgetter(4), records), dtype=np.float64, count=n)
+
+        # Most holders are small and funded; drop them before running the rules
+        candidates = np.flatnonzero(
+            (pcts >= self._min_flag_pct()) | (bnbs < self.min_gas_bnb)
+        )
+        masks = np.zeros(n, dtype=np.int64)
+        masks[candidates] = self._rule_bits(pcts[candidates], txs[candidates], bnbs[candidates])
+        return masks
+
+    def _min_flag_pct(self) -> float:
+        """Lowest balance_pct any rule can fire at, apart from INSUFFICIENT_GAS"""
+        return min(0.5, self.min_suspicious_pct)
+
+    def _rule_bits(self, balance_pct, tx_count, bnb_balance):
+        """
+        Branchless rule evaluation; bit i is set when _FLAG_RULES[i] matches.
 
-        return flags
+        Only comparisons and arithmetic, so it works on scalars as well as
+        NumPy arrays.
+        """
+        large = balance_pct >= self.min_suspicious_pct
+        zero_tx = tx_count == 0
+
+        return (
+            (zero_tx & large) * 1                                            # Flag 1
+            | ((tx_count == 1) & large) * 2                                  # Flag 2
+            | (bnb_balance < self.min_gas_bnb) * 4                           # Flag 3
+            | ((balance_pct >= 1.5) & (tx_count < 5) & (tx_count > 0)) * 8   # Flag 4
+            | (zero_tx & (balance_pct >= 0.5)) * 16                          # Flag 5
+            | ((bnb_balance < 0.001) & (balance_pct >= 1.0)) * 32            # Flag 6
+        )
+
+    def _build_flags(
+        self,
+        mask: int,
+        balance_pct: float,
+        tx_count: int,
+        bnb_balance: float
+    ) -> Tuple[SuspiciousFlag, ...]:
+        """Materialize the flags selected by mask; descriptions are only formatted here"""
+        return tuple(
+            SuspiciousFlag(
+                type=flag_type,
+                description=template.format(
+                    pct=balance_pct, txs=tx_count, bnb=bnb_balance, min_gas=self.min_gas_bnb
+                ),
+                severity=severity,
+                score=score
+            )
+            for i, (flag_type, severity, score, template) in enumerate(_FLAG_RULES)
+            if mask >> i & 1
+        )
 
     def _generate_recommendation(
         self,
-        flags: List[SuspiciousFlag],
+        flags: Tuple[SuspiciousFlag, ...],
         risk_score: int
     ) -> str:
         """Generate monitoring recommendation"""
 
-        if risk_score >= 70:
+        if risk_score >= self.CRITICAL_SCORE:
             return "🚨 CRITICAL: Monitor 24/7. Alert on ANY BNB deposit or transaction."
-        elif risk_score >= 50:
+        elif risk_score >= self.HIGH_SCORE:
             return "⚠️  HIGH: Monitor daily. Alert on BNB deposit or first transaction."
-        elif risk_score >= 30:
+        elif risk_score >= self.MEDIUM_SCORE:
             return "⚠️  MEDIUM: Monitor weekly. Check for balance changes."
         else:
             return "ℹ️  LOW: Periodic monitoring sufficient."
@@ -208,47 +311,39 @@ class SuspiciousDetector:
         if not suspicious:
             return "✓ No suspicious holders detected."
 
-        report = []
-        report.append(f"=== Suspicious Holders Detected: {len(suspicious)} ===\n")
+        # Every line after the first is written with a leading newline
+        buf = io.StringIO()
+        w = buf.write
+        w(f"=== Suspicious Holders Detected: {len(suspicious)} ===\n")
 
         for i, holder in enumerate(suspicious, 1):
-            report.append(f"\n{i}. {holder.address[:10]}...{holder.address[-8:]}")
-            report.append(f"   Balance: {holder.balance:,.0f} ({holder.balance_pct:.2f}%)")
-            report.append(f"   Tx Count: {holder.tx_count}")
-            report.append(f"   BNB: {holder.bnb_balance:.6f}")
-            report.append(f"   Risk Score: {holder.risk_score}/100")
-            report.append(f"   Recommendation: {holder.recommendation}")
-            report.append(f"\n   Flags:")
-
-            for flag in holder.flags:
-                severity_icon = {
-                    SuspicionLevel.CRITICAL: "🔴",
-                    SuspicionLevel.HIGH: "🟠",
-                    SuspicionLevel.MEDIUM: "🟡",
-                    SuspicionLevel.LOW: "🟢"
-                }[flag.severity]
-
-                report.append(f"   {severity_icon} [{flag.type}] {flag.description}")
+            w(_render_holder(i, holder))
 
         # Summary statistics
-        report.append(f"\n=== Summary ===")
-        report.append(f"Total suspicious holders: {len(suspicious)}")
-
-        critical = sum(1 for h in suspicious if h.risk_score >= 70)
-        high = sum(1 for h in suspicious if 50 <= h.risk_score < 70)
-        medium = sum(1 for h in suspicious if 30 <= h.risk_score < 50)
+        w("\n\n=== Summary ===")
+        w(f"\nTotal suspicious holders: {len(suspicious)}")
+
+        critical = high = medium = 0
+        total_suspicious_pct = 0.0
+        for h in suspicious:
+            if h.risk_score >= self.CRITICAL_SCORE:
+                critical += 1
+            elif h.risk_score >= self.HIGH_SCORE:
+                high += 1
+            elif h.risk_score >= self.MEDIUM_SCORE:
+                medium += 1
+            total_suspicious_pct += h.balance_pct
 
         if critical > 0:
-            report.append(f"🔴 Critical risk: {critical}")
+            w(f"\n🔴 Critical risk: {critical}")
         if high > 0:
-            report.append(f"🟠 High risk: {high}")
+            w(f"\n🟠 High risk: {high}")
         if medium > 0:
-            report.append(f"🟡 Medium risk: {medium}")
+            w(f"\n🟡 Medium risk: {medium}")
 
-        total_suspicious_pct = sum(h.balance_pct for h in suspicious)
-        report.append(f"\nTotal suspicious holdings: {total_suspicious_pct:.2f}% of supply")
+        w(f"\n\nTotal suspicious holdings: {total_suspicious_pct:.2f}% of supply")
 
-        return "\n".join(report)
+        return buf.getvalue()
 
 
 # CLI
@@ -328,4 +423,8 @@ if __name__ == "__main__":
                     for f in holder.flags
                 ]
             })
-        print(json.dumps(output, indent=2))
+        try:
+            import orjson
+            print(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
+        except ImportError:
+            print(json.dumps(output, indent=2))
@@ -12,15 +12,69 @@ Based on research:
 - Solana getSignaturesForAddress
 """
 
-import time
-from typing import List, Dict, Optional, Any, Tuple
-from dataclasses import dataclass
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import List, Dict, Optional, Any, Tuple, Iterator
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .rpc_manager import RPCManager, Chain, RPCError, AllRPCsFailedError, BATCH_LIMIT
+    from .cache_manager import CacheManager
+except ImportError:
+    from rpc_manager import RPCManager, Chain, RPCError, AllRPCsFailedError, BATCH_LIMIT
+    from cache_manager import CacheManager
+
+# ciso8601 (optional C extension) parses ISO timestamps far faster than fromisoformat
 try:
-    from .rpc_manager import RPCManager, Chain, AllRPCsFailedError
+    import ciso8601
+
+    def _parse_timestamp(value: str) -> int:
+        return int(ciso8601.parse_datetime(value).timestamp())
 except ImportError:
-    from rpc_manager import RPCManager, Chain, AllRPCsFailedError
+    def _parse_timestamp(value: str) -> int:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+
+
+def _address_topic(address: str) -> str:
+    """Address left-padded to a 32-byte log topic"""
+    return "0x" + address[2:].lower().rjust(64, "0")
+
+
+def _block_ranges(start: int, end: int, size: int) -> List[Tuple[int, int]]:
+    """Contiguous inclusive (from, to) ranges covering start..end, each spanning at most size blocks"""
+    ranges = []
+    current = start
+    while current <= end:
+        chunk_end = min(current + size, end)
+        ranges.append((current, chunk_end))
+        current = chunk_end + 1
+    return ranges
+
+
+# Max concurrent per-address lookups (network-bound)
+FETCH_MAX_WORKERS = 16
+
+# Widest block range a single activity eth_getLogs query covers
+ACTIVITY_CHUNK_SIZE = 10000
+
+# Ranges up to this many blocks fetch all Transfer logs once and filter locally
+# instead of sending separate from/to queries
+FUSED_QUERY_MAX_RANGE = 500
+
+# Block number -> timestamp entries kept per fetcher (oldest dropped first)
+BLOCK_TIMESTAMP_CACHE_SIZE = 50_000
+
+# First-activity blocks never change once found; keep them for 30 days
+FIRST_BLOCK_CACHE_NAMESPACE = "first_block"
+FIRST_BLOCK_CACHE_TTL = 30 * 24 * 3600
 
 
 @dataclass
@@ -36,6 +90,55 @@ class Transaction:
     token_address: Optional[str] = None
 
 
+@dataclass
+class TransactionBatch(Sequence):
+    """
+    Column-oriented (struct-of-arrays) transaction records.
+
+    Holds one list per Transaction field instead of one object per
+    transaction; indexing and iteration produce Transaction views, so it
+    can be used wherever a List[Transaction] is expected.
+    """
+    hashes: List[str] = field(default_factory=list)
+    block_numbers: List[int] = field(default_factory=list)
+    timestamps: List[int] = field(default_factory=list)
+    from_addresses: List[str] = field(default_factory=list)
+    to_addresses: List[str] = field(default_factory=list)
+    values: List[str] = field(default_factory=list)
+    methods: List[Optional[str]] = field(default_factory=list)
+    token_addresses: List[Optional[str]] = field(default_factory=list)
+
+    def append_from_log(self, log: Dict[str, Any]):
+        """Append a Transfer log (topics: signature, from, to)"""
+        topics = log['topics']
+        self.hashes.append(log['transactionHash'])
+        self.block_numbers.append(int(log['blockNumber'], 16))
+        self.timestamps.append(0)  # Filled in by _fill_timestamps
+        self.from_addresses.append('0x' + topics[1][-40:])
+        self.to_addresses.append('0x' + topics[2][-40:])
+        self.values.append(log['data'])
+        self.methods.append(None)
+        self.token_addresses.append(log['address'])
+
+    def _columns(self) -> Tuple[List[Any], ...]:
+        return (
+            self.hashes, self.block_numbers, self.timestamps, self.from_addresses,
+            self.to_addresses, self.values, self.methods, self.token_addresses
+        )
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TransactionBatch(*(column[index] for column in self._columns()))
+        return Transaction(*(column[index] for column in self._columns()))
+
+    def __iter__(self):
+        for row in zip(*self._columns()):
+            yield Transaction(*row)
+
+
 class TransactionHistoryFetcher:
     """
     Fetch transaction history with automatic fallback strategies.
@@ -51,7 +154,8 @@ class TransactionHistoryFetcher:
         self,
         chain: str,
         rpc_manager: Optional[RPCManager] = None,
-        blockscout_url: Optional[str] = None
+        blockscout_url: Optional[str] = None,
+        cache: Optional[CacheManager] = None
     ):
         """
         Initialize fetcher.
@@ -60,10 +164,25 @@ class TransactionHistoryFetcher:
             chain: Chain name (eth, base, bsc, solana)
             rpc_manager: Optional RPC manager instance
             blockscout_url: Optional Blockscout API URL
+            cache: Optional cache for first-activity blocks found by binary search
         """
         self.chain = chain.lower()
         self.rpc_manager = rpc_manager
         self.blockscout_url = blockscout_url
+        self.cache = cache
+        self._block_timestamps: Dict[int, int] = {}
+        # iter_first_transactions workers share the timestamp cache
+        self._timestamps_lock = threading.Lock()
+
+        # Keep-alive pool shared by all Blockscout requests (and worker threads);
+        # requests decodes compressed bodies transparently
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        self._http.headers.update({
+            'User-Agent': 'Mozilla/5.0',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
+        })
 
         # Blockscout URLs
         if not self.blockscout_url:
@@ -77,7 +196,7 @@ class TransactionHistoryFetcher:
         self,
         addresses: List[str],
         limit: int = 10
-    ) -> Dict[str, List[Transaction]]:
+    ) -> Dict[str, Sequence[Transaction]]:
         """
         Get first N transactions for multiple addresses.
 
@@ -86,22 +205,52 @@ class TransactionHistoryFetcher:
             limit: Max transactions per address
 
         Returns:
-            Dict mapping address to list of transactions
+            Dict mapping address to list of transactions, in input order
         """
-        results = {}
+        found = dict(self.iter_first_transactions(addresses, limit))
+        return {address: found[address] for address in addresses if address in found}
 
-        for address in addresses:
-            txs = self._get_address_first_txs(address, limit)
-            if txs:
-                results[address] = txs
+    def iter_first_transactions(
+        self,
+        addresses: List[str],
+        limit: int = 10
+    ) -> Iterator[Tuple[str, Sequence[Transaction]]]:
+        """
+        Yield first N transactions per address as each lookup completes.
 
-        return results
+        Addresses without transactions are skipped. Lookups still queued
+        when the caller stops iterating are cancelled.
+
+        Args:
+            addresses: List of addresses
+            limit: Max transactions per address
+
+        Yields:
+            (address, transactions) tuples in completion order
+        """
+        if not addresses:
+            return
+
+        # Lookups overlap their network round trips
+        workers = min(FETCH_MAX_WORKERS, len(addresses))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                pool.submit(self._get_address_first_txs, address, limit): address
+                for address in addresses
+            }
+            for future in as_completed(futures):
+                txs = future.result()
+                if txs:
+                    yield futures[future], txs
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def _get_address_first_txs(
         self,
         address: str,
         limit: int
-    ) -> List[Transaction]:
+    ) -> Sequence[Transaction]:
         """Get first transactions for single address"""
 
         # Strategy 1: Blockscout API
@@ -124,32 +273,26 @@ class TransactionHistoryFetcher:
         limit: int
     ) -> Optional[List[Transaction]]:
         """Fetch from Blockscout API"""
-        import urllib.request
-        import json
-
         try:
             url = f"{self.blockscout_url}/api/v2/addresses/{address}/transactions"
-            url += f"?filter=to%20%7C%20from&type=&limit={limit}"
-
-            req = urllib.request.Request(url, headers={
-                'User-Agent': 'Mozilla/5.0',
-                'Accept': 'application/json'
-            })
+            url += f"?filter=to%20%7C%20from&limit={limit}"
 
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                data = json.loads(resp.read().decode())
+            # Decode straight from the response stream, no intermediate bytes/str copies;
+            # decode_content lets urllib3 undo the gzip/deflate transfer encoding
+            with self._http.get(url, timeout=15, stream=True) as resp:
+                resp.raise_for_status()
+                resp.raw.decode_content = True
+                data = json.load(resp.raw)
 
             if not data or 'items' not in data:
                 return None
 
             txs = []
-            for item in data['items'][:limit]:
+            for item in islice(data['items'], limit):
                 tx = Transaction(
                     hash=item['hash'],
                     block_number=int(item['block']),
-                    timestamp=int(datetime.fromisoformat(
-                        item['timestamp'].replace('Z', '+00:00')
-                    ).timestamp()),
+                    timestamp=_parse_timestamp(item['timestamp']),
                     from_address=item['from']['hash'],
                     to_address=item['to']['hash'] if item.get('to') else '',
                     value=item['value'],
@@ -167,7 +310,7 @@ class TransactionHistoryFetcher:
         self,
         address: str,
         limit: int
-    ) -> Optional[List[Transaction]]:
+    ) -> Optional[TransactionBatch]:
         """
         Fetch using eth_getLogs with binary search.
 
@@ -183,13 +326,23 @@ class TransactionHistoryFetcher:
             current_block_hex = self.rpc_manager.call("eth_blockNumber", [])
             current_block = int(current_block_hex, 16)
 
-            # Binary search for first transaction
-            first_block = self._binary_search_first_block(
-                address, 0, current_block
-            )
+            # Binary search for first transaction (skipped on a cache hit)
+            first_block = self._cached_first_block(address)
+            if first_block is None or first_block > current_block:
+                first_block = self._binary_search_first_block(
+                    address, 0, current_block, padded=_address_topic(address)
+                )
 
-            if first_block is None:
-                return None
+                if first_block is None:
+                    return None
+
+                if self.cache is not None:
+                    self.cache.set(
+                        FIRST_BLOCK_CACHE_NAMESPACE,
+                        self._first_block_key(address),
+                        first_block,
+                        ttl=FIRST_BLOCK_CACHE_TTL
+                    )
 
             # Fetch transactions from first block
             return self._fetch_txs_from_block(
@@ -200,36 +353,62 @@ class TransactionHistoryFetcher:
             print(f"[RPC] Error fetching {address}: {e}")
             return None
 
+    def _first_block_key(self, address: str) -> str:
+        return f"{self.chain}:{address.lower()}"
+
+    def _cached_first_block(self, address: str) -> Optional[int]:
+        """First-activity block from a previous search of this exact address"""
+        if self.cache is None:
+            return None
+        return self.cache.get(FIRST_BLOCK_CACHE_NAMESPACE, self._first_block_key(address))
+
     def _binary_search_first_block(
         self,
         address: str,
         start: int,
         end: int,
-        max_iterations: int = 20
+        max_iterations: int = 20,
+        padded: Optional[str] = None
     ) -> Optional[int]:
-        """Binary search to find first block with activity"""
-
-        # Check if address has any activity
-        has_activity = self._check_block_range_activity(
-            address, start, end
-        )
+        """
+        Find first block with activity.
 
-        if not has_activity:
-            return None
+        Gallops forward from start over windows that double in width, so
+        activity shortly after start is found in a few probes, then binary
+        searches inside the first active window. Every probe covers its
+        whole window; RPC errors propagate rather than read as inactivity.
+        """
+        padded = padded or _address_topic(address)
+
+        # Each window starts right after the previous one, which was checked
+        # end to end and found inactive, so activity in it means the first
+        # active block lies inside it
+        left, width = start, ACTIVITY_CHUNK_SIZE
+        while True:
+            right = min(left + width, end)
+            if self._check_block_range_activity(address, left, right, padded):
+                break
+            if right >= end:
+                return None
+            left, width = right + 1, width * 2
 
         # Binary search
-        left, right = start, end
         result = None
 
         for _ in range(max_iterations):
             if left >= right:
                 break
 
+            # One query over the remaining window beats ~log2(chunk) more probes
+            if right - left <= ACTIVITY_CHUNK_SIZE:
+                first = self._first_active_block(address, left, right, padded)
+                return first if first is not None else result
+
             mid = (left + right) // 2
 
             # Check left half
             has_left = self._check_block_range_activity(
-                address, left, mid
+                address, left, mid, padded
             )
 
             if has_left:
@@ -238,52 +417,94 @@ class TransactionHistoryFetcher:
             else:
                 left = mid + 1
 
-            time.sleep(0.5)  # Rate limit protection
-
         return result
 
     def _check_block_range_activity(
         self,
         address: str,
         from_block: int,
-        to_block: int
+        to_block: int,
+        padded: Optional[str] = None
     ) -> bool:
-        """Check if address has activity in block range"""
+        """
+        Check if address has activity anywhere in the block range.
 
-        # Limit range to avoid rate limits
-        chunk_size = 10000
-        if to_block - from_block > chunk_size:
-            to_block = from_block + chunk_size
+        The whole range is queried, split into ACTIVITY_CHUNK_SIZE sub-ranges
+        sent in one batch. Errors are raised, not reported as False, so a
+        failed probe is never mistaken for an empty range.
+        """
+        incoming, outgoing = self._transfer_logs(address, from_block, to_block, padded)
+        return bool(incoming) or bool(outgoing)
 
-        try:
-            # Check for incoming transfers
+    def _first_active_block(
+        self,
+        address: str,
+        from_block: int,
+        to_block: int,
+        padded: Optional[str] = None
+    ) -> Optional[int]:
+        """Lowest block in range with a Transfer to or from address; RPC errors propagate"""
+        incoming, outgoing = self._transfer_logs(address, from_block, to_block, padded)
+
+        blocks = [int(log['blockNumber'], 16) for log in (incoming or []) + (outgoing or [])]
+        return min(blocks) if blocks else None
+
+    def _transfer_logs(
+        self,
+        address: str,
+        from_block: int,
+        to_block: int,
+        padded: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Incoming and outgoing Transfer logs, fetched with a single call or batch_call"""
+        padded = padded or _address_topic(address)
+
+        # Log filters cannot OR across topic positions, so narrow ranges use one
+        # unfiltered Transfer query and split it client-side
+        if to_block - from_block <= FUSED_QUERY_MAX_RANGE:
             logs = self.rpc_manager.call("eth_getLogs", [{
                 "fromBlock": hex(from_block),
                 "toBlock": hex(to_block),
+                "topics": [
+                    "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+                ]
+            }]) or []
+            incoming = [
+                log for log in logs
+                if len(log['topics']) >= 3 and log['topics'][2].lower() == padded
+            ]
+            outgoing = [
+                log for log in logs
+                if len(log['topics']) >= 2 and log['topics'][1].lower() == padded
+            ]
+            return incoming, outgoing
+
+        # Providers cap eth_getLogs block spans, so wide ranges go out as
+        # ACTIVITY_CHUNK_SIZE sub-ranges: an incoming/outgoing pair per sub-range
+        calls = []
+        for chunk_start, chunk_end in _block_ranges(from_block, to_block, ACTIVITY_CHUNK_SIZE):
+            calls.append(("eth_getLogs", [{
+                "fromBlock": hex(chunk_start),
+                "toBlock": hex(chunk_end),
                 "topics": [
                     "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",  # Transfer
                     None,
-                    f"0x000000000000000000000000{address[2:].lower()}"  # to
+                    padded  # to
                 ]
-            }])
-
-            if logs and len(logs) > 0:
-                return True
-
-            # Check for outgoing transfers
-            logs = self.rpc_manager.call("eth_getLogs", [{
-                "fromBlock": hex(from_block),
-                "toBlock": hex(to_block),
+            }]))
+            calls.append(("eth_getLogs", [{
+                "fromBlock": hex(chunk_start),
+                "toBlock": hex(chunk_end),
                 "topics": [
                     "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
-                    f"0x000000000000000000000000{address[2:].lower()}",  # from
+                    padded,  # from
                 ]
-            }])
+            }]))
 
-            return logs and len(logs) > 0
-
-        except Exception:
-            return False
+        results = self.rpc_manager.batch_call(calls)
+        incoming = [log for logs in results[0::2] for log in logs or []]
+        outgoing = [log for logs in results[1::2] for log in logs or []]
+        return incoming, outgoing
 
     def _fetch_txs_from_block(
         self,
@@ -291,68 +512,112 @@ class TransactionHistoryFetcher:
         start_block: int,
         end_block: int,
         limit: int
-    ) -> List[Transaction]:
+    ) -> TransactionBatch:
         """Fetch transactions starting from block"""
 
-        txs = []
+        txs = TransactionBatch()
         chunk_size = 5000
-        current = start_block
+        padded = _address_topic(address)
+
+        ranges = _block_ranges(start_block, end_block, chunk_size)
+
+        # One batched request per BATCH_LIMIT chunks instead of one request per chunk
+        for batch_start in range(0, len(ranges), BATCH_LIMIT):
+            if len(txs) >= limit:
+                break
 
-        while current <= end_block and len(txs) < limit:
-            chunk_end = min(current + chunk_size, end_block)
+            batch = ranges[batch_start:batch_start + BATCH_LIMIT]
+            first, last = batch[0][0], batch[-1][1]
 
             try:
                 # Fetch Transfer events
-                logs = self.rpc_manager.call("eth_getLogs", [{
-                    "fromBlock": hex(current),
-                    "toBlock": hex(chunk_end),
-                    "topics": [
-                        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-                    ]
-                }])
+                chunk_logs = self.rpc_manager.batch_call([
+                    ("eth_getLogs", [{
+                        "fromBlock": hex(chunk_start),
+                        "toBlock": hex(chunk_end),
+                        "topics": [
+                            "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+                        ]
+                    }])
+                    for chunk_start, chunk_end in batch
+                ], return_errors=True)
+            except AllRPCsFailedError:
+                print(f"[RPC] All endpoints failed for range {first}-{last}")
+                break
+            except Exception as e:
+                print(f"[RPC] Error in range {first}-{last}: {e}")
+                continue
+
+            for (chunk_start, chunk_end), logs in zip(batch, chunk_logs):
+                # A failed range only skips itself, not the rest of the batch
+                if isinstance(logs, RPCError):
+                    print(f"[RPC] Error in range {chunk_start}-{chunk_end}: {logs}")
+                    continue
 
                 # Parse logs
-                for log in logs[:limit - len(txs)]:
-                    if len(log['topics']) < 3:
-                        continue
-
-                    from_addr = '0x' + log['topics'][1][-40:]
-                    to_addr = '0x' + log['topics'][2][-40:]
-
-                    if from_addr.lower() == address.lower() or \
-                       to_addr.lower() == address.lower():
-
-                        tx = Transaction(
-                            hash=log['transactionHash'],
-                            block_number=int(log['blockNumber'], 16),
-                            timestamp=0,  # Need separate call
-                            from_address=from_addr,
-                            to_address=to_addr,
-                            value=log['data'],
-                            token_address=log['address']
-                        )
-                        txs.append(tx)
+                for i in self._matching_log_indices(logs or [], padded)[:limit - len(txs)]:
+                    txs.append_from_log(logs[i])
 
                 if len(txs) >= limit:
                     break
 
-            except AllRPCsFailedError:
-                print(f"[RPC] All endpoints failed for range {current}-{chunk_end}")
-                break
-            except Exception as e:
-                print(f"[RPC] Error in range {current}-{chunk_end}: {e}")
+        txs = txs[:limit]
+        self._fill_timestamps(txs)
+        return txs
 
-            current = chunk_end + 1
-            time.sleep(0.3)  # Rate limit protection
+    def _fill_timestamps(self, txs: TransactionBatch):
+        """Set block timestamps, fetching each uncached block once in a single batch"""
+        with self._timestamps_lock:
+            missing = sorted(set(txs.block_numbers).difference(self._block_timestamps))
 
-        return txs[:limit]
+        if missing:
+            try:
+                blocks = self.rpc_manager.batch_call([
+                    ("eth_getBlockByNumber", [hex(block), False]) for block in missing
+                ], return_errors=True)
+            except Exception as e:
+                print(f"[RPC] Error fetching block timestamps: {e}")
+                blocks = []
+
+            fetched = {
+                block_number: int(block['timestamp'], 16)
+                for block_number, block in zip(missing, blocks)
+                if isinstance(block, dict) and 'timestamp' in block
+            }
+        else:
+            fetched = {}
+
+        # The RPC round trip runs unlocked; only cache reads and writes hold the lock
+        with self._timestamps_lock:
+            cached = self._block_timestamps
+            cached.update(fetched)
+            while len(cached) > BLOCK_TIMESTAMP_CACHE_SIZE:
+                del cached[next(iter(cached))]
+            txs.timestamps = [
+                fetched.get(block) or cached.get(block, 0) for block in txs.block_numbers
+            ]
+
+    @staticmethod
+    def _matching_log_indices(logs: List[Dict[str, Any]], padded: str) -> np.ndarray:
+        """Indices of Transfer logs sent from or to the padded address, in log order"""
+        if not logs:
+            return np.empty(0, dtype=np.intp)
+
+        senders = np.array(
+            [log['topics'][1] if len(log['topics']) >= 3 else '' for log in logs], dtype='U66'
+        )
+        recipients = np.array(
+            [log['topics'][2] if len(log['topics']) >= 3 else '' for log in logs], dtype='U66'
+        )
+        mask = (np.char.lower(senders) == padded) | (np.char.lower(recipients) == padded)
+        return np.flatnonzero(mask)
 
     def get_transaction_timeline(
         self,
         address: str,
         start_block: int,
         end_block: int
-    ) -> List[Transaction]:
+    ) -> TransactionBatch:
         """
         Get transaction timeline in block range.
 
@@ -362,7 +627,7 @@ class TransactionHistoryFetcher:
             end_block: End block number
 
         Returns:
-            List of transactions sorted by block
+            Transactions sorted by block
         """
         return self._fetch_txs_from_block(
             address, start_block, end_block, limit=1000
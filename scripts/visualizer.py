@@ -8,10 +8,41 @@ Features:
 - Cluster visualization
 """
 
+import heapq
+import io
 import json
+import textwrap
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from functools import lru_cache
+
+# ciso8601 (optional C extension) parses ISO timestamps far faster than fromisoformat
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Timeline event type -> icon
+_ICON_MAP = {
+    'deploy': '🚀',
+    'launch': '🎯',
+    'suspicious': '⚠️',
+    'cluster': '🔗',
+    'alert': '🚨',
+    'info': 'ℹ️'
+}
+_ICON_GET = _ICON_MAP.get
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(timestamp: str) -> str:
+    """Format an ISO timestamp for the timeline, memoized per string"""
+    try:
+        return _parse_iso(timestamp).strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        return timestamp[:16]
 
 
 class Visualizer:
@@ -32,6 +63,10 @@ class Visualizer:
             width: Chart width in characters
         """
         self.width = width
+        # Bars are sliced from one pre-rendered run instead of str * int per row
+        self._bar_char = "█"
+        self._full_bar = self._bar_char * width
+        self._hr = "=" * width
 
     def generate_holder_distribution(
         self,
@@ -51,38 +86,38 @@ class Visualizer:
         if not holders:
             return "No holder data available"
 
-        # Sort by percentage
-        sorted_holders = sorted(
+        # Select the top holders by percentage without sorting the full list
+        sorted_holders = heapq.nlargest(
+            top_n,
             holders,
-            key=lambda h: h.get('balance_pct', 0),
-            reverse=True
-        )[:top_n]
+            key=lambda h: h.get('balance_pct', 0)
+        )
 
-        lines = []
-        lines.append("=" * self.width)
-        lines.append("Holder Distribution (Top {})".format(top_n))
-        lines.append("=" * self.width)
-        lines.append("")
+        max_pct = sorted_holders[0].get('balance_pct', 0)
 
-        max_pct = max(h.get('balance_pct', 0) for h in sorted_holders)
+        rows = "\n".join(
+            self._holder_row(i, holder, max_pct)
+            for i, holder in enumerate(sorted_holders, 1)
+        )
 
-        for i, holder in enumerate(sorted_holders, 1):
-            addr = holder.get('address', 'Unknown')
-            pct = holder.get('balance_pct', 0)
-
-            # Truncate address
-            addr_short = f"{addr[:6]}...{addr[-4:]}" if len(addr) > 10 else addr
+        return (
+            f"{self._hr}\nHolder Distribution (Top {top_n})\n{self._hr}\n\n"
+            f"{rows}\n\n{self._hr}"
+        )
 
-            # Calculate bar length
-            bar_width = int((pct / max_pct) * (self.width - 25)) if max_pct > 0 else 0
-            bar = "█" * bar_width
+    def _holder_row(self, index: int, holder: Dict[str, Any], max_pct: float) -> str:
+        """Render one holder distribution row"""
+        addr = holder.get('address', 'Unknown')
+        pct = holder.get('balance_pct', 0)
 
-            lines.append(f"{i:2d}. {addr_short:12s} {bar} {pct:5.2f}%")
+        # Truncate address
+        addr_short = f"{addr[:6]}...{addr[-4:]}" if len(addr) > 10 else addr
 
-        lines.append("")
-        lines.append("=" * self.width)
+        # Calculate bar length
+        bar_width = int((pct / max_pct) * (self.width - 25)) if max_pct > 0 else 0
+        bar = self._full_bar[:max(0, bar_width)]
 
-        return "\n".join(lines)
+        return f"{index:2d}. {addr_short:12s} {bar} {pct:5.2f}%"
 
     def generate_risk_gauge(
         self,
@@ -99,15 +134,9 @@ class Visualizer:
         Returns:
             ASCII gauge
         """
-        lines = []
-        lines.append("=" * self.width)
-        lines.append("Risk Assessment")
-        lines.append("=" * self.width)
-        lines.append("")
-
         # Risk gauge
         risk_bar_len = int((risk_score / 100) * (self.width - 20))
-        risk_bar = "█" * risk_bar_len
+        risk_bar = self._full_bar[:max(0, risk_bar_len)]
 
         if risk_score >= 70:
             risk_label = "🔴 CRITICAL"
@@ -118,19 +147,17 @@ class Visualizer:
         else:
             risk_label = "🟢 LOW"
 
-        lines.append(f"Risk Score:       {risk_bar} {risk_score:.1f}/100")
-        lines.append(f"Risk Level:       {risk_label}")
-        lines.append("")
-
         # Confidence gauge
         conf_bar_len = int((confidence_score / 100) * (self.width - 20))
-        conf_bar = "█" * conf_bar_len
-
-        lines.append(f"Confidence:       {conf_bar} {confidence_score:.1f}/100")
-        lines.append("")
-        lines.append("=" * self.width)
+        conf_bar = self._full_bar[:max(0, conf_bar_len)]
 
-        return "\n".join(lines)
+        return (
+            f"{self._hr}\nRisk Assessment\n{self._hr}\n\n"
+            f"Risk Score:       {risk_bar} {risk_score:.1f}/100\n"
+            f"Risk Level:       {risk_label}\n\n"
+            f"Confidence:       {conf_bar} {confidence_score:.1f}/100\n\n"
+            f"{self._hr}"
+        )
 
     def generate_suspicious_summary(
         self,
@@ -148,11 +175,9 @@ class Visualizer:
         if not suspicious:
             return "✓ No suspicious holders detected"
 
-        lines = []
-        lines.append("=" * self.width)
-        lines.append(f"Suspicious Holders ({len(suspicious)})")
-        lines.append("=" * self.width)
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"{self._hr}\nSuspicious Holders ({len(suspicious)})\n{self._hr}\n\n")
 
         for i, holder in enumerate(suspicious[:10], 1):
             addr = holder.get('address', 'Unknown')
@@ -168,19 +193,19 @@ class Visualizer:
             else:
                 icon = "🟡"
 
-            lines.append(f"{i:2d}. {icon} {addr_short:18s} Risk: {risk:3d}/100")
+            w(f"{i:2d}. {icon} {addr_short:18s} Risk: {risk:3d}/100\n")
 
             if flags:
                 flag_str = ", ".join(flags[:3])
                 if len(flag_str) > self.width - 8:
                     flag_str = flag_str[:self.width - 11] + "..."
-                lines.append(f"    Flags: {flag_str}")
+                w(f"    Flags: {flag_str}\n")
 
-            lines.append("")
+            w("\n")
 
-        lines.append("=" * self.width)
+        w(self._hr)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def generate_cluster_summary(
         self,
@@ -198,11 +223,9 @@ class Visualizer:
         if not clusters:
             return "No clusters detected"
 
-        lines = []
-        lines.append("=" * self.width)
-        lines.append(f"Holder Clusters ({len(clusters)})")
-        lines.append("=" * self.width)
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"{self._hr}\nHolder Clusters ({len(clusters)})\n{self._hr}\n\n")
 
         for i, cluster in enumerate(clusters[:5], 1):
             cluster_id = cluster.get('id', f'Cluster {i}')
@@ -211,20 +234,22 @@ class Visualizer:
             risk = cluster.get('risk_score', 0)
             signals = cluster.get('signals', [])
 
-            lines.append(f"{i}. {cluster_id}")
-            lines.append(f"   Members: {len(members)}")
-            lines.append(f"   Holdings: {total_pct:.2f}%")
-            lines.append(f"   Risk: {risk:.1f}/100")
+            w(
+                f"{i}. {cluster_id}\n"
+                f"   Members: {len(members)}\n"
+                f"   Holdings: {total_pct:.2f}%\n"
+                f"   Risk: {risk:.1f}/100\n"
+            )
 
             if signals:
                 signal_str = ", ".join(signals[:2])
-                lines.append(f"   Signals: {signal_str}")
+                w(f"   Signals: {signal_str}\n")
 
-            lines.append("")
+            w("\n")
 
-        lines.append("=" * self.width)
+        w(self._hr)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def generate_timeline(
         self,
@@ -242,11 +267,9 @@ class Visualizer:
         if not events:
             return "No timeline events"
 
-        lines = []
-        lines.append("=" * self.width)
-        lines.append("Timeline")
-        lines.append("=" * self.width)
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"{self._hr}\nTimeline\n{self._hr}\n\n")
 
         for event in events:
             timestamp = event.get('timestamp', 'Unknown')
@@ -254,61 +277,29 @@ class Visualizer:
             description = event.get('description', '')
 
             # Format timestamp
-            if isinstance(timestamp, str):
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    time_str = dt.strftime('%Y-%m-%d %H:%M')
-                except:
-                    time_str = timestamp[:16]
-            else:
-                time_str = str(timestamp)[:16]
+            time_str = _fmt_ts(timestamp) if isinstance(timestamp, str) else str(timestamp)[:16]
 
             # Event icon
-            icon_map = {
-                'deploy': '🚀',
-                'launch': '🎯',
-                'suspicious': '⚠️',
-                'cluster': '🔗',
-                'alert': '🚨',
-                'info': 'ℹ️'
-            }
-            icon = icon_map.get(event_type.lower(), '•')
-
-            lines.append(f"{time_str} {icon} {event_type}")
+            icon = _ICON_GET(event_type.lower() if event_type else '', '•')
+
+            w(f"{time_str} {icon} {event_type}\n")
 
             if description:
                 # Wrap description
-                desc_lines = self._wrap_text(description, self.width - 4)
+                desc_lines = textwrap.wrap(
+                    description,
+                    width=self.width - 4,
+                    break_long_words=False,
+                    break_on_hyphens=False
+                )
                 for desc_line in desc_lines:
-                    lines.append(f"  {desc_line}")
-
-            lines.append("")
-
-        lines.append("=" * self.width)
+                    w(f"  {desc_line}\n")
 
-        return "\n".join(lines)
-
-    def _wrap_text(self, text: str, width: int) -> List[str]:
-        """Wrap text to specified width"""
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            if current_length + len(word) + 1 <= width:
-                current_line.append(word)
-                current_length += len(word) + 1
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
+            w("\n")
 
-        if current_line:
-            lines.append(" ".join(current_line))
+        w(self._hr)
 
-        return lines
+        return buf.getvalue()
 
     def generate_full_report(
         self,
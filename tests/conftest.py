@@ -0,0 +1,90 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Test modules import scripts by plain name; sys.modules then keeps one copy
+sys.path.insert(0, str(ROOT / "scripts"))
+
+SCORE_PAYLOAD = {
+    "co_funder": 0.9,
+    "co_time": 0.8,
+    "co_amount": 0.6,
+    "co_exit": 0.7,
+    "shared_sink": 0.8,
+    "pre_pump_accumulation": 0.9,
+    "early_cluster_share": 0.7,
+    "synchronized_exit": 0.6,
+    "shared_funder": 0.9,
+    "shared_sink_insider": 0.8,
+    "deterministic_strength": 0.8,
+    "cross_source_agreement": 0.7,
+    "temporal_stability": 0.9,
+}
+
+CALIBRATION_DATASET = {
+    "records": [
+        {
+            "chain": "Solana",
+            "lp_usd": 110000,
+            "label": 1,
+            "relation_score": 0.87,
+            "insider_score": 0.79,
+            "link_confidence": 84,
+        },
+        {
+            "chain": "Solana",
+            "lp_usd": 115000,
+            "label": 0,
+            "relation_score": 0.35,
+            "insider_score": 0.31,
+            "link_confidence": 48,
+        },
+    ]
+}
+
+
+@pytest.fixture(scope="session")
+def calibration_module():
+    return importlib.import_module("calibrate_thresholds")
+
+
+@pytest.fixture(scope="session")
+def probe_module():
+    return importlib.import_module("rpc_probe_cloudscraper")
+
+
+@pytest.fixture(scope="session")
+def score_models():
+    return importlib.import_module("score_models")
+
+
+@pytest.fixture(scope="session")
+def score_sample():
+    # Read-only view; tests derive variants with {**score_sample, ...}
+    return MappingProxyType(SCORE_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def score_payload_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("score") / "payload.json"
+    path.write_text(json.dumps(SCORE_PAYLOAD, separators=(",", ":")), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def calibration_dataset_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("calibration") / "dataset.json"
+    path.write_text(json.dumps(CALIBRATION_DATASET, separators=(",", ":")), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def chain_trace_module():
+    return importlib.import_module("chain_trace")
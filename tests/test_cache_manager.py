@@ -0,0 +1,51 @@
+import pytest
+
+import cache_manager
+
+
+CacheManager = cache_manager.CacheManager
+
+
+def test_index_is_saved_once_per_group(tmp_path, monkeypatch):
+    cache = CacheManager(tmp_path)
+    dumps = []
+    real_dump = cache_manager.json.dump
+
+    def dump(*args, **kwargs):
+        dumps.append(args[0])
+        return real_dump(*args, **kwargs)
+
+    monkeypatch.setattr(cache_manager.json, "dump", dump)
+    with cache:
+        cache.set("test", "key1", {"value": 123}, ttl=60)
+        cache.set("test2", "key1", {"value": 456}, ttl=60)
+        assert not (tmp_path / "index.json").exists()
+        assert cache.get("test", "key1") == {"value": 123}
+
+    assert len(dumps) == 1
+    assert CacheManager(tmp_path).stats()["entries"] == 2
+
+
+def test_sets_outside_a_group_save_immediately(tmp_path):
+    cache = CacheManager(tmp_path)
+    cache.set("test", "key1", 1, ttl=60)
+
+    assert CacheManager(tmp_path).get("test", "key1") == 1
+
+
+def test_index_is_flushed_when_group_raises(tmp_path):
+    cache = CacheManager(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with cache:
+            cache.set("test", "key1", 1, ttl=60)
+            raise RuntimeError("boom")
+
+    assert CacheManager(tmp_path).get("test", "key1") == 1
+
+
+def test_empty_group_writes_nothing(tmp_path):
+    with CacheManager(tmp_path):
+        pass
+
+    assert not (tmp_path / "index.json").exists()
@@ -1,150 +1,128 @@
-import importlib.util
 import subprocess
 import sys
-import unittest
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SCRIPT = ROOT / 'scripts' / 'chain_trace.py'
 
 
-class ChainTraceCliTests(unittest.TestCase):
-    def test_cli_help_runs(self):
-        result = subprocess.run(
-            [sys.executable, str(SCRIPT), '--help'],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        self.assertEqual(result.returncode, 0, msg=result.stderr)
-        self.assertIn('Chain Trace', result.stdout)
-
-    def test_solana_support_normalizes_token_and_holder_data(self):
-        spec = importlib.util.spec_from_file_location('chain_trace_module', SCRIPT)
-        if spec is None or spec.loader is None:
-            raise RuntimeError('unable to load scripts/chain_trace.py')
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        tracer = module.ChainTrace(chain='solana', mode='quick')
-
-        class FakeSolscan:
-            def token_data(self, mint: str):
-                return {
-                    'supply': {
-                        'value': {
-                            'uiAmountString': '975289876.890878',
-                            'decimals': 6,
-                        }
-                    }
-                }
-
-            def token_holders(self, mint: str, page: int = 1, page_size: int = 100):
-                return {
-                    'accounts': [
-                        {
-                            'address': 'Holder1111111111111111111111111111111111111',
-                            'amount': '1200000',
-                            'decimals': 6,
-                            'uiAmountString': '1.2',
-                        },
-                        {
-                            'address': 'Holder2222222222222222222222222222222222222',
-                            'amount': '800000',
-                            'decimals': 6,
-                            'uiAmountString': '0.8',
-                        },
-                    ]
-                }
-
-        tracer.explorer = FakeSolscan()
-
-        holders = tracer._fetch_holders('mint')
-
-        self.assertEqual(holders[0]['address']['hash'], 'Holder1111111111111111111111111111111111111')
-        self.assertAlmostEqual(holders[0]['value'], 1.2)
-        self.assertAlmostEqual(holders[1]['value'], 0.8)
-
-    def test_solana_token_info_merges_market_and_mint_metadata(self):
-        spec = importlib.util.spec_from_file_location('chain_trace_module', SCRIPT)
-        if spec is None or spec.loader is None:
-            raise RuntimeError('unable to load scripts/chain_trace.py')
+@pytest.mark.slow
+def test_cli_help_runs():
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), '--help'],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert 'Chain Trace' in result.stdout
 
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
 
-        tracer = module.ChainTrace(chain='solana', mode='quick')
+def test_solana_support_normalizes_token_and_holder_data(chain_trace_module):
+    tracer = chain_trace_module.ChainTrace(chain='solana', mode='quick')
 
-        class FakeSolscan:
-            def account_info(self, mint: str):
-                return {
-                    'tokenInfo': {
+    class FakeSolscan:
+        def token_data(self, mint: str):
+            return {
+                'supply': {
+                    'value': {
+                        'uiAmountString': '975289876.890878',
+                        'decimals': 6,
+                    }
+                }
+            }
+
+        def token_holders(self, mint: str, page: int = 1, page_size: int = 100):
+            return {
+                'accounts': [
+                    {
+                        'address': 'Holder1111111111111111111111111111111111111',
+                        'amount': '1200000',
                         'decimals': 6,
-                        'freezeAuthority': None,
-                        'tokenAuthority': None,
-                        'creator': 'Creator111',
-                        'ownExtensions': {
-                            'website': 'https://www.molt.id/',
-                            'twitter': 'https://x.com/moltdotid',
-                        },
+                        'uiAmountString': '1.2',
                     },
-                    'metadata': {
-                        'data': {
-                            'name': 'MoltID',
-                            'symbol': 'MOLTID',
-                        }
+                    {
+                        'address': 'Holder2222222222222222222222222222222222222',
+                        'amount': '800000',
+                        'decimals': 6,
+                        'uiAmountString': '0.8',
                     },
-                }
-
-            def token_holders_total(self, mint: str):
-                return {'holders': 876, 'supply': 975289876890878}
-
-            def token_data(self, mint: str):
-                return {}
-
-            def token_holders(self, mint: str, page: int = 1, page_size: int = 100):
-                return None
-
-        tracer.explorer = FakeSolscan()
-        tracer._fetch_solana_market_info = lambda mint: {
-            'price_usd': 0.000718,
-            'market_cap_usd': 699530.6,
-            'fdv_usd': 700280.25,
-            'liquidity_usd': 51701.08,
-            'volume_24h_usd': 32339.49,
-        }
+                ]
+            }
 
-        info = tracer._fetch_token_info('mint')
+    tracer.explorer = FakeSolscan()
 
-        self.assertEqual(info['name'], 'MoltID')
-        self.assertEqual(info['symbol'], 'MOLTID')
-        self.assertEqual(info['holder_count'], 876)
-        self.assertAlmostEqual(info['price_usd'], 0.000718)
-        self.assertIsNone(info['mint_authority'])
-        self.assertIsNone(info['freeze_authority'])
+    holders = tracer._fetch_holders('mint')
 
-    def test_missing_holder_data_lowers_confidence(self):
-        spec = importlib.util.spec_from_file_location('chain_trace_module', SCRIPT)
-        if spec is None or spec.loader is None:
-            raise RuntimeError('unable to load scripts/chain_trace.py')
+    assert holders[0]['address']['hash'] == 'Holder1111111111111111111111111111111111111'
+    assert holders[0]['value'] == pytest.approx(1.2)
+    assert holders[1]['value'] == pytest.approx(0.8)
 
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
 
-        tracer = module.ChainTrace(chain='solana', mode='deep')
-        tracer.results = {
-            'token_info': {'name': 'MoltID'},
-            'holders': [],
-            'suspicious': {'count': 0, 'holders': []},
-            'clusters': {'cluster_count': 0, 'anomaly_count': 0, 'risk_score': 0.0},
-        }
+def test_solana_token_info_merges_market_and_mint_metadata(chain_trace_module):
+    tracer = chain_trace_module.ChainTrace(chain='solana', mode='quick')
 
-        risk = tracer._calculate_risk()
-
-        self.assertEqual(risk['verdict'], 'Unknown')
-        self.assertLess(risk['confidence_score'], 100)
-
-
-if __name__ == '__main__':
-    unittest.main()
+    class FakeSolscan:
+        def account_info(self, mint: str):
+            return {
+                'tokenInfo': {
+                    'decimals': 6,
+                    'freezeAuthority': None,
+                    'tokenAuthority': None,
+                    'creator': 'Creator111',
+                    'ownExtensions': {
+                        'website': 'https://www.molt.id/',
+                        'twitter': 'https://x.com/moltdotid',
+                    },
+                },
+                'metadata': {
+                    'data': {
+                        'name': 'MoltID',
+                        'symbol': 'MOLTID',
+                    }
+                },
+            }
+
+        def token_holders_total(self, mint: str):
+            return {'holders': 876, 'supply': 975289876890878}
+
+        def token_data(self, mint: str):
+            return {}
+
+        def token_holders(self, mint: str, page: int = 1, page_size: int = 100):
+            return None
+
+    tracer.explorer = FakeSolscan()
+    tracer._fetch_solana_market_info = lambda mint: {
+        'price_usd': 0.000718,
+        'market_cap_usd': 699530.6,
+        'fdv_usd': 700280.25,
+        'liquidity_usd': 51701.08,
+        'volume_24h_usd': 32339.49,
+    }
+
+    info = tracer._fetch_token_info('mint')
+
+    assert info['name'] == 'MoltID'
+    assert info['symbol'] == 'MOLTID'
+    assert info['holder_count'] == 876
+    assert info['price_usd'] == pytest.approx(0.000718)
+    assert info['mint_authority'] is None
+    assert info['freeze_authority'] is None
+
+
+def test_missing_holder_data_lowers_confidence(chain_trace_module):
+    tracer = chain_trace_module.ChainTrace(chain='solana', mode='deep')
+    tracer.results = {
+        'token_info': {'name': 'MoltID'},
+        'holders': [],
+        'suspicious': {'count': 0, 'holders': []},
+        'clusters': {'cluster_count': 0, 'anomaly_count': 0, 'risk_score': 0.0},
+    }
+
+    risk = tracer._calculate_risk()
+
+    assert risk['verdict'] == 'Unknown'
+    assert risk['confidence_score'] < 100
@@ -0,0 +1,355 @@
+import json
+
+import pytest
+
+import rpc_manager
+
+
+Chain = rpc_manager.Chain
+RPCEndpoint = rpc_manager.RPCEndpoint
+RPCManager = rpc_manager.RPCManager
+
+
+def test_bucket_refuses_when_empty_and_refills_over_time(monkeypatch):
+    endpoint = RPCEndpoint(url="https://rpc.example", rate=2.0, tokens=2.0)
+
+    monkeypatch.setattr(rpc_manager.time, "monotonic", lambda: 100.0)
+    endpoint.last_refill = 100.0
+    assert endpoint.try_take_token()
+    assert endpoint.try_take_token()
+    assert not endpoint.try_take_token()
+
+    monkeypatch.setattr(rpc_manager.time, "monotonic", lambda: 100.5)
+    assert endpoint.try_take_token()
+    assert not endpoint.try_take_token()
+
+
+def test_drained_bucket_blocks_until_refill(monkeypatch):
+    endpoint = RPCEndpoint(url="https://rpc.example", rate=5.0)
+
+    monkeypatch.setattr(rpc_manager.time, "monotonic", lambda: 50.0)
+    endpoint.drain_tokens()
+    assert not endpoint.try_take_token()
+
+    monkeypatch.setattr(rpc_manager.time, "monotonic", lambda: 50.4)
+    assert endpoint.try_take_token()
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, text=""):
+        self.status_code = status_code
+        self._body = body
+        self.text = text
+
+    def json(self):
+        return self._body
+
+
+class FakeSession:
+    def __init__(self, responder):
+        self.responder = responder
+        self.urls = []
+
+    def post(self, url, data=None, timeout=None):
+        self.urls.append(url)
+        return self.responder(url, data)
+
+
+def ok_responder(url, data):
+    return FakeResponse(body={"jsonrpc": "2.0", "id": 1, "result": "0x1"})
+
+
+def batch_responder(url, data):
+    calls = json.loads(data)
+    if not isinstance(calls, list):
+        return FakeResponse(body={"jsonrpc": "2.0", "id": calls["id"], "result": "single"})
+    # Answer out of order to exercise id-based demultiplexing
+    return FakeResponse(body=[
+        {"jsonrpc": "2.0", "id": call["id"], "result": call["params"][0]}
+        for call in reversed(calls)
+    ])
+
+
+def test_round_robin_spreads_calls_within_top_tier():
+    manager = RPCManager(Chain.ETH, lb_policy="rr")
+    manager._http = FakeSession(ok_responder)
+    tier1 = [e.url for e in manager.endpoints if e.tier == 1]
+
+    for _ in range(len(tier1)):
+        assert manager.call("eth_blockNumber", []) == "0x1"
+
+    assert sorted(manager._http.urls) == sorted(tier1)
+
+
+def test_tier_policy_keeps_hitting_first_endpoint():
+    manager = RPCManager(Chain.ETH, lb_policy="tier")
+    manager._http = FakeSession(ok_responder)
+
+    for _ in range(3):
+        manager.call("eth_blockNumber", [])
+
+    assert set(manager._http.urls) == {manager.endpoints[0].url}
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        RPCManager(Chain.ETH, lb_policy="random")
+
+
+def test_batch_results_follow_call_order():
+    manager = RPCManager(Chain.ETH)
+    manager._http = FakeSession(batch_responder)
+
+    results = manager.batch_call([("eth_getBalance", [f"0x{i}"]) for i in range(5)])
+
+    assert results == [f"0x{i}" for i in range(5)]
+    assert len(manager._http.urls) == 1
+
+
+def test_large_batches_are_split():
+    manager = RPCManager(Chain.ETH)
+    manager._http = FakeSession(batch_responder)
+    calls = [("eth_getBalance", [i]) for i in range(rpc_manager.BATCH_LIMIT * 2 + 1)]
+
+    assert manager.batch_call(calls) == list(range(len(calls)))
+    assert len(manager._http.urls) == 3
+
+
+def test_item_error_raises():
+    manager = RPCManager(Chain.ETH)
+    manager._http = FakeSession(lambda url, data: FakeResponse(body=[
+        {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32602, "message": "invalid params"}},
+    ]))
+
+    with pytest.raises(rpc_manager.RPCError, match="invalid params"):
+        manager.batch_call([("eth_getLogs", [{}]), ("eth_getLogs", [{}])])
+
+
+def test_item_errors_can_be_returned_in_place():
+    manager = RPCManager(Chain.ETH)
+    manager._http = FakeSession(lambda url, data: FakeResponse(body=[
+        {"jsonrpc": "2.0", "id": 2, "result": "0x3"},
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "query timeout"}},
+        {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+    ]))
+
+    results = manager.batch_call([("eth_getLogs", [{}])] * 4, return_errors=True)
+
+    assert results[0] == "0x1"
+    assert isinstance(results[1], rpc_manager.RPCError)
+    assert "query timeout" in str(results[1])
+    assert results[2] == "0x3"
+    assert "missing batch reply" in str(results[3])
+
+
+def test_rejected_batch_falls_back_to_single_calls():
+    manager = RPCManager(Chain.ETH)
+
+    def responder(url, data):
+        if data.startswith(b"["):
+            return FakeResponse(400)
+        return batch_responder(url, data)
+
+    manager._http = FakeSession(responder)
+
+    assert manager.batch_call([("eth_blockNumber", []), ("eth_chainId", [])]) == [
+        "single", "single",
+    ]
+
+
+def test_empty_batch_makes_no_requests():
+    manager = RPCManager(Chain.ETH)
+    manager._http = FakeSession(batch_responder)
+
+    assert manager.batch_call([]) == []
+    assert manager._http.urls == []
+
+
+def test_rate_limit_error_code_switches_endpoint():
+    manager = RPCManager(Chain.ETH, lb_policy="tier")
+    first = manager.endpoints[0]
+
+    def responder(url, data):
+        if url == first.url:
+            return FakeResponse(body={
+                "jsonrpc": "2.0", "id": 1,
+                "error": {"code": -32005, "message": "limit exceeded"},
+            })
+        return ok_responder(url, data)
+
+    manager._http = FakeSession(responder)
+
+    assert manager.call("eth_blockNumber", []) == "0x1"
+    assert manager._http.urls[:2] == [first.url, manager.endpoints[1].url]
+    assert not first.try_take_token()
+    # Throttled, not failed: no cooldown, so it is eligible again once refilled
+    assert first.is_available()
+
+
+def test_empty_buckets_wait_for_token_deficit(monkeypatch):
+    manager = RPCManager(Chain.ETH, max_retries=1)
+    manager._http = FakeSession(ok_responder)
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rpc_manager.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rpc_manager.time, "sleep", sleep)
+    for endpoint in manager.endpoints:
+        endpoint.drain_tokens()
+        endpoint.tokens = 0.5
+
+    assert manager.call("eth_blockNumber", []) == "0x1"
+    assert sleeps == [pytest.approx(0.1)]
+
+
+def test_empty_buckets_do_not_exhaust_retries(monkeypatch):
+    manager = RPCManager(Chain.ETH, max_retries=1)
+    manager._http = FakeSession(
+        lambda url, data: FakeResponse(body=[{"jsonrpc": "2.0", "id": 0, "result": "0x1"}])
+    )
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        # Other workers keep emptying the buckets for a few rounds
+        if len(sleeps) < 5:
+            for endpoint in manager.endpoints:
+                endpoint.drain_tokens()
+        else:
+            for endpoint in manager.endpoints:
+                endpoint.tokens = 1.0
+
+    for endpoint in manager.endpoints:
+        endpoint.drain_tokens()
+    monkeypatch.setattr(rpc_manager.time, "sleep", sleep)
+
+    assert manager.batch_call([("eth_blockNumber", [])]) == ["0x1"]
+    assert len(sleeps) == 5
+    assert all(seconds <= 0.2 for seconds in sleeps)
+    assert all(endpoint.is_available() for endpoint in manager.endpoints)
+
+
+def test_rate_limited_endpoints_are_retried_after_backoff(monkeypatch):
+    manager = RPCManager(Chain.ETH, max_retries=1)
+    manager._http = FakeSession(lambda url, data: FakeResponse(status_code=429))
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rpc_manager.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rpc_manager.time, "sleep", sleep)
+    for endpoint in manager.endpoints:
+        endpoint.last_refill = 0.0
+
+    with pytest.raises(rpc_manager.AllRPCsFailedError):
+        manager.call("eth_blockNumber", [])
+
+    # Throttle backoff, then the token deficit, then every endpoint once more
+    assert sleeps == [0.1, pytest.approx(0.1)]
+    assert sorted(manager._http.urls) == sorted([e.url for e in manager.endpoints] * 2)
+    assert all(endpoint.is_available() for endpoint in manager.endpoints)
+
+
+def test_rate_limited_batch_recovers_on_next_round(monkeypatch):
+    manager = RPCManager(Chain.ETH, max_retries=1)
+    replies = iter([FakeResponse(status_code=429)] * len(manager.endpoints))
+    manager._http = FakeSession(lambda url, data: next(replies, None) or batch_responder(url, data))
+    clock = [0.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr(rpc_manager.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rpc_manager.time, "sleep", sleep)
+    for endpoint in manager.endpoints:
+        endpoint.last_refill = 0.0
+
+    assert manager.batch_call([("eth_getBalance", ["0x1"])]) == ["0x1"]
+    assert len(manager._http.urls) == len(manager.endpoints) + 1
+
+
+def test_throttle_backoff_is_capped(monkeypatch):
+    manager = RPCManager(Chain.ETH)
+    sleeps = []
+    monkeypatch.setattr(rpc_manager.time, "sleep", sleeps.append)
+
+    for throttle_round in range(8):
+        manager._throttle_sleep(throttle_round)
+
+    assert sleeps[:3] == [0.1, 0.2, 0.4]
+    assert max(sleeps) == 2.0
+
+
+def test_stats_track_endpoint_health_in_place():
+    manager = RPCManager(Chain.ETH)
+    stats = manager.get_stats()
+    first = manager.endpoints[0]
+
+    first.mark_success(0.5)
+    first.mark_failure()
+
+    entry = stats["endpoints"][0]
+    assert entry["url"] == first.url
+    assert entry["total_requests"] == 2
+    assert entry["success_rate"] == 0.5
+    assert entry["cooldown_until"] is not None
+
+    refreshed = manager.get_stats()
+    assert not refreshed["endpoints"][0]["available"]
+    assert refreshed["available_endpoints"] == refreshed["total_endpoints"] - 1
+
+
+def test_stats_follow_round_robin_order():
+    manager = RPCManager(Chain.ETH, lb_policy="rr")
+    manager._http = FakeSession(ok_responder)
+
+    manager.call("eth_blockNumber", [])
+    manager.call("eth_blockNumber", [])
+
+    assert [entry["url"] for entry in manager.get_stats()["endpoints"]] == [
+        endpoint.url for endpoint in manager.endpoints
+    ]
+    assert manager.get_stats()["endpoints"][-1]["total_requests"] == 1
+
+
+def test_decorrelated_jitter_stays_within_bounds(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(rpc_manager.time, "sleep", sleeps.append)
+
+    previous = rpc_manager.RETRY_SLEEP_BASE
+    for _ in range(20):
+        total = RPCManager._retry_sleep(previous)
+        assert total == sleeps[-1]
+        assert 0.5 <= total <= min(16.0, previous * 3.0)
+        previous = total
+
+
+def test_retry_backoff_starts_from_base_on_every_call(monkeypatch):
+    manager = RPCManager(Chain.ETH, lb_policy="tier", max_retries=2)
+
+    def responder(url, data):
+        raise rpc_manager.requests.exceptions.Timeout()
+
+    manager._http = FakeSession(responder)
+    sleeps = []
+    monkeypatch.setattr(rpc_manager.time, "sleep", sleeps.append)
+    monkeypatch.setattr(rpc_manager.random, "uniform", lambda low, high: high)
+
+    for _ in range(2):
+        with pytest.raises(rpc_manager.AllRPCsFailedError):
+            manager.call("eth_blockNumber", [])
+        for endpoint in manager.endpoints:
+            endpoint.cooldown_until = None
+
+    # One retry per endpoint; the jitter grows within a call and resets for the next
+    per_call = len(sleeps) // 2
+    assert sleeps[:3] == [1.5, 4.5, 13.5]
+    assert sleeps[per_call:] == sleeps[:per_call]
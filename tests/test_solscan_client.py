@@ -0,0 +1,321 @@
+import json
+import sys
+
+import pytest
+
+import solscan_client
+
+
+SolscanClient = solscan_client.SolscanClient
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    @property
+    def content(self):
+        return json.dumps(self._body).encode()
+
+
+class FakePost:
+    """Stands in for Session.post; records the URL of every request"""
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.urls = []
+
+    def __call__(self, url, data=None, timeout=None):
+        self.urls.append(url)
+        if isinstance(self.responder, Exception):
+            raise self.responder
+        if isinstance(self.responder, FakeResponse):
+            return self.responder
+        return self.responder(url, data=data, timeout=timeout)
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def batch_responder(url, data=None, timeout=None):
+    calls = json.loads(data)
+    # Answer out of order to exercise id-based demultiplexing
+    replies = [
+        {"jsonrpc": "2.0", "id": call["id"], "result": {"sig": call["params"][0]}}
+        for call in reversed(calls)
+    ]
+    return FakeResponse(body=replies)
+
+
+@pytest.fixture
+def client():
+    return SolscanClient(prefer_solscan=False)
+
+
+def use_post(monkeypatch, client, responder):
+    post = FakePost(responder)
+    monkeypatch.setattr(client._session, "post", post)
+    return post
+
+
+def test_failed_endpoint_rotates_to_next_without_sleeping(client, monkeypatch):
+    first, second = solscan_client.SOLANA_RPCS[:2]
+
+    def responder(url, data=None, timeout=None):
+        if url == first:
+            return FakeResponse(503)
+        return FakeResponse(body={"jsonrpc": "2.0", "id": 1, "result": 42})
+
+    post = use_post(monkeypatch, client, responder)
+
+    assert client._rpc_call("getSlot", []) == 42
+    assert post.urls == [first, second]
+    assert client._rpc_fails[first] == 1
+
+
+def test_encoded_call_is_compact_json_bytes():
+    assert SolscanClient._encode_call("getSlot", [], 7) == (
+        b'{"jsonrpc":"2.0","id":7,"method":"getSlot","params":[]}'
+    )
+
+
+def test_encoded_calls_get_increasing_ids():
+    first = json.loads(SolscanClient._encode_call("getTransaction", ["sig", {"a": 1}]))
+    second = json.loads(SolscanClient._encode_call("getTransaction", ["sig2"]))
+
+    assert second["id"] > first["id"]
+    assert first["params"] == ["sig", {"a": 1}]
+    assert second["method"] == "getTransaction"
+
+
+def test_first_successful_endpoint_wins(client, monkeypatch):
+    failing = solscan_client.SOLANA_RPCS[0]
+
+    def responder(url, data=None, timeout=None):
+        if url == failing:
+            raise ConnectionError("boom")
+        return FakeResponse(body={"jsonrpc": "2.0", "id": 1, "result": {"lamports": 1}})
+
+    use_post(monkeypatch, client, responder)
+
+    assert client._rpc_get_account_info("Addr111") == {"lamports": 1}
+
+
+def test_non_object_reply_only_fails_that_endpoint(monkeypatch):
+    # One worker: the first endpoint's reply is always seen before the others
+    monkeypatch.setattr(solscan_client, "RPC_RACE_WORKERS", 1)
+    client = SolscanClient(prefer_solscan=False)
+    odd = solscan_client.SOLANA_RPCS[0]
+
+    def responder(url, data=None, timeout=None):
+        if url == odd:
+            return FakeResponse(body=["not", "an", "object"])
+        return FakeResponse(body={"jsonrpc": "2.0", "id": 1, "result": {"lamports": 1}})
+
+    use_post(monkeypatch, client, responder)
+
+    assert client._rpc_get_account_info("Addr111") == {"lamports": 1}
+    assert client._rpc_fails[odd] == 1
+
+
+def test_all_endpoints_failing_returns_none_and_counts_failures(client, monkeypatch):
+    use_post(monkeypatch, client, ConnectionError("down"))
+
+    assert client._rpc_get_transaction("sig") is None
+    assert {client._rpc_fails[rpc] for rpc in solscan_client.SOLANA_RPCS} == {1}
+
+
+def test_races_share_the_client_pool(client, monkeypatch):
+    use_post(monkeypatch, client, FakeResponse(body={"jsonrpc": "2.0", "id": 1, "result": 7}))
+    created = []
+    monkeypatch.setattr(solscan_client, "ThreadPoolExecutor", lambda *a, **kw: created.append(a))
+
+    assert client._rpc_call_raced("getSlot", []) == 7
+    assert client._rpc_call_raced("getSlot", []) == 7
+    assert created == []
+
+
+def test_settled_race_does_not_send_queued_requests(monkeypatch):
+    monkeypatch.setattr(solscan_client, "RPC_RACE_WORKERS", 1)
+    client = SolscanClient(prefer_solscan=False)
+    tokens = {rpc: limiter._tokens for rpc, limiter in client._limiters.items()}
+    post = use_post(
+        monkeypatch, client, FakeResponse(body={"jsonrpc": "2.0", "id": 1, "result": 7})
+    )
+
+    assert client._rpc_call_raced("getSlot", []) == 7
+    client._race_pool.shutdown(wait=True)
+
+    assert post.urls == [solscan_client.SOLANA_RPCS[0]]
+    for rpc in solscan_client.SOLANA_RPCS[1:]:
+        assert client._limiters[rpc]._tokens >= tokens[rpc]
+
+
+def test_rpc_only_client_never_imports_solscan(monkeypatch):
+    solscan_client._import_solscan.cache_clear()
+    monkeypatch.setitem(sys.modules, "free_solscan_api", None)
+    client = SolscanClient(prefer_solscan=False)
+
+    assert client.source == "public_rpc"
+    assert solscan_client._import_solscan.cache_info().currsize == 0
+
+
+def test_missing_package_falls_back_to_rpc(monkeypatch):
+    solscan_client._import_solscan.cache_clear()
+    monkeypatch.setitem(sys.modules, "free_solscan_api", None)
+    client = SolscanClient(prefer_solscan=True)
+    solscan_client._import_solscan.cache_clear()
+
+    assert client.source == "public_rpc"
+
+
+def test_acquire_blocks_once_bucket_is_empty(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(solscan_client, "time", clock)
+    limiter = solscan_client._RateLimiter(2.0)
+
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == []
+    limiter.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_429_halves_rate_and_honours_retry_after(client, monkeypatch):
+    rpc = solscan_client.SOLANA_RPCS[0]
+    limiter = client._limiters[rpc]
+    initial_rate = limiter.rate
+    use_post(monkeypatch, client, FakeResponse(429, headers={"Retry-After": "7"}))
+
+    client._send(rpc, b"{}")
+
+    assert limiter.rate == initial_rate / 2
+    assert limiter._paused_until > solscan_client.time.monotonic() + 6
+
+
+def test_rate_recovers_after_successful_responses(client, monkeypatch):
+    rpc = solscan_client.SOLANA_RPCS[0]
+    monkeypatch.setattr(solscan_client, "time", FakeClock())
+    limiter = client._limiters[rpc] = solscan_client._RateLimiter(4.0)
+
+    use_post(monkeypatch, client, FakeResponse(429))
+    for _ in range(4):
+        client._send(rpc, b"{}")
+    assert limiter.rate == limiter.min_rate
+
+    use_post(monkeypatch, client, FakeResponse(body={"jsonrpc": "2.0", "id": 1, "result": 1}))
+    for _ in range(10):
+        client._send(rpc, b"{}")
+    assert limiter.rate == 4.0
+
+
+def test_parse_retry_after():
+    assert solscan_client._parse_retry_after("3") == 3.0
+    assert solscan_client._parse_retry_after(None) is None
+    assert solscan_client._parse_retry_after("soon") is None
+    assert solscan_client._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_backoff_is_full_jitter_and_capped(monkeypatch):
+    retry = SolscanClient._create_session().get_adapter("https://x").max_retries
+    assert isinstance(retry, solscan_client._JitterRetry)
+    assert retry.get_backoff_time() == 0.0
+
+    bounds = []
+    monkeypatch.setattr(
+        solscan_client.random, "uniform", lambda low, high: bounds.append((low, high)) or 0.1
+    )
+    for attempt in range(8):
+        retry = retry.increment(method="POST", url="/")
+        retry.total = 10
+        assert retry.get_backoff_time() == 0.1
+
+    assert bounds == [(0, min(8.0, 0.25 * 2 ** attempt)) for attempt in range(8)]
+
+
+def test_account_info_is_cached_until_ttl_expires(client, monkeypatch):
+    calls = []
+    client._rpc_get_account_info = lambda address: calls.append(address) or {"a": address}
+
+    monkeypatch.setattr(solscan_client.time, "monotonic", lambda: 1000.0)
+    assert client.account_info("Addr1") == {"a": "Addr1"}
+    assert client.account_info("Addr1") == {"a": "Addr1"}
+    client.account_info("Addr2")
+    assert calls == ["Addr1", "Addr2"]
+
+    monkeypatch.setattr(solscan_client.time, "monotonic", lambda: 1031.0)
+    client.account_info("Addr1")
+    assert calls == ["Addr1", "Addr2", "Addr1"]
+
+
+def test_missing_results_are_not_cached(client):
+    calls = []
+    client._rpc_get_transaction = lambda tx_hash: calls.append(tx_hash)
+
+    assert client.transaction("sig") is None
+    assert client.transaction("sig") is None
+    assert calls == ["sig", "sig"]
+
+
+def test_lru_evicts_oldest_entry():
+    cache = solscan_client._TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_transactions_bulk_demultiplexes_by_id(client, monkeypatch):
+    post = use_post(monkeypatch, client, batch_responder)
+
+    results = client.transactions_bulk(["sig1", "sig2", "sig3"])
+
+    assert [r["sig"] for r in results] == ["sig1", "sig2", "sig3"]
+    assert len(post.urls) == 1
+
+
+def test_batches_are_split_at_limit(client, monkeypatch):
+    sigs = [f"sig{i}" for i in range(solscan_client.RPC_BATCH_LIMIT + 1)]
+    post = use_post(monkeypatch, client, batch_responder)
+
+    results = client.transactions_bulk(sigs)
+
+    assert [r["sig"] for r in results] == sigs
+    assert len(post.urls) == 2
+
+
+def test_rejected_batch_falls_back_to_individual_calls(client, monkeypatch):
+    client._rpc_call = lambda method, params: {"method": method, "sig": params[0]}
+    use_post(monkeypatch, client, FakeResponse(413))
+
+    results = client.transactions_bulk(["sig1", "sig2"])
+
+    assert [r["sig"] for r in results] == ["sig1", "sig2"]
+
+
+def test_empty_bulk_makes_no_calls(client, monkeypatch):
+    post = use_post(monkeypatch, client, batch_responder)
+
+    assert client.transactions_bulk([]) == []
+    assert post.urls == []
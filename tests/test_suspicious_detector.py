@@ -0,0 +1,146 @@
+import dataclasses
+import itertools
+
+import pytest
+
+import suspicious_detector
+
+
+SuspiciousDetector = suspicious_detector.SuspiciousDetector
+
+
+def make_holder(index, balance_pct, tx_count, bnb_balance):
+    return {
+        "address": f"0x{index:040x}",
+        "balance": balance_pct * 1_000_000,
+        "balance_pct": balance_pct,
+        "tx_count": tx_count,
+        "bnb_balance": bnb_balance,
+    }
+
+
+# Values sit on and around every rule threshold
+GRID = [
+    make_holder(i, pct, txs, bnb)
+    for i, (pct, txs, bnb) in enumerate(
+        itertools.product(
+            [0.0, 0.49, 0.5, 0.99, 1.0, 1.22, 1.5, 2.2],
+            [0, 1, 2, 4, 5, 245],
+            [0.0, 0.0009, 0.001, 0.004999, 0.005, 0.035],
+        )
+    )
+]
+
+
+def expected_flag_types(holder, min_pct=1.0, min_gas=0.005):
+    """Plain restatement of the detection rules, in _FLAG_RULES order"""
+    pct, txs, bnb = holder["balance_pct"], holder["tx_count"], holder["bnb_balance"]
+    rules = [
+        ("ZERO_TX_LARGE_HOLDING", txs == 0 and pct >= min_pct),
+        ("SINGLE_TX_LARGE_HOLDING", txs == 1 and pct >= min_pct),
+        ("INSUFFICIENT_GAS", bnb < min_gas),
+        ("LARGE_HOLDING_LOW_ACTIVITY", pct >= 1.5 and 0 < txs < 5),
+        ("RECEIVED_NEVER_MOVED", txs == 0 and pct >= 0.5),
+        ("LOCKED_BY_GAS", bnb < 0.001 and pct >= 1.0),
+    ]
+    return [flag_type for flag_type, matched in rules if matched]
+
+
+@pytest.fixture
+def detector():
+    return SuspiciousDetector()
+
+
+def test_vector_masks_match_scalar_rules(detector):
+    masks = detector._flag_masks(list(map(suspicious_detector._HOLDER_RECORD, GRID)))
+    flagged = {h.address: h for h in detector._detect_chunk(GRID)}
+
+    for holder, mask in zip(GRID, masks):
+        expected = expected_flag_types(holder)
+        assert bin(int(mask)).count("1") == len(expected), holder
+        result = flagged.get(holder["address"])
+        flags = result.flags if result else ()
+        assert [f.type for f in flags] == expected, holder
+
+
+def test_low_threshold_detector_still_flags_small_holders():
+    detector = SuspiciousDetector(min_suspicious_pct=0.2)
+    holder = make_holder(0, 0.3, 0, 0.01)
+
+    [result] = detector.detect([holder, make_holder(1, 0.1, 0, 0.01)])
+    assert [f.type for f in result.flags] == expected_flag_types(holder, min_pct=0.2)
+    assert result.risk_score == 40
+
+
+def test_flag_descriptions_are_formatted_lazily(detector):
+    [result] = detector._detect_chunk([make_holder(0, 1.22, 0, 0.0005)])
+    flags = result.flags
+
+    assert [f.type for f in flags] == [
+        "ZERO_TX_LARGE_HOLDING",
+        "INSUFFICIENT_GAS",
+        "RECEIVED_NEVER_MOVED",
+        "LOCKED_BY_GAS",
+    ]
+    assert flags[0].description == "Zero transactions but holds 1.22% of supply"
+    assert flags[1].description == "Only 0.000500 BNB (< 0.005 threshold)"
+
+
+def test_detect_returns_flagged_holders_by_descending_score(detector):
+    suspicious = detector.detect(GRID)
+
+    flagged = [h for h in GRID if expected_flag_types(h)]
+    assert len(suspicious) == len(flagged)
+    assert [h.risk_score for h in suspicious] == sorted(
+        (h.risk_score for h in suspicious), reverse=True
+    )
+    for holder in suspicious:
+        assert holder.risk_score == sum(f.score for f in holder.flags)
+
+
+def test_top_k_matches_head_of_full_ranking(detector):
+    full = detector.detect(GRID)
+
+    for k in (0, 1, 5, len(full) + 10):
+        assert detector.detect(GRID, top_k=k) == full[:k]
+
+
+def test_parallel_detection_matches_single_process(detector, monkeypatch):
+    holders = GRID * 3
+    expected = detector.detect(holders)
+
+    monkeypatch.setattr(SuspiciousDetector, "PARALLEL_THRESHOLD", 10)
+    monkeypatch.setattr(suspicious_detector.os, "cpu_count", lambda: 4)
+    assert detector.detect(holders) == expected
+    assert detector.detect(holders, top_k=7) == expected[:7]
+
+
+def test_results_are_frozen_slotted_records(detector):
+    holder = detector.detect(GRID)[0]
+
+    assert isinstance(holder.flags, tuple)
+    assert not hasattr(holder, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        holder.risk_score = 0
+
+
+def test_empty_input(detector):
+    assert detector.detect([]) == []
+
+
+def test_report_layout(detector):
+    holder = make_holder(6, 1.22, 0, 0.001)
+    holder["address"] = "0x76075401bbbb958daa6aeb1811941cf223d4deb9"
+    report = detector.generate_report(detector.detect([holder]))
+
+    lines = report.split("\n")
+    assert lines[:3] == ["=== Suspicious Holders Detected: 1 ===", "", ""]
+    assert lines[3] == "1. 0x76075401...23d4deb9"
+    assert "   🔴 [ZERO_TX_LARGE_HOLDING] Zero transactions but holds 1.22% of supply" in lines
+    assert "🔴 Critical risk: 1" in lines
+    assert lines[-1] == "Total suspicious holdings: 1.22% of supply"
+    assert lines[-2] == ""
+
+
+def test_empty_report(detector):
+    assert detector.generate_report([]) == "✓ No suspicious holders detected."
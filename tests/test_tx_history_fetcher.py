@@ -0,0 +1,497 @@
+import io
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+import tx_history_fetcher
+
+
+TransactionHistoryFetcher = tx_history_fetcher.TransactionHistoryFetcher
+Transaction = tx_history_fetcher.Transaction
+
+
+def make_tx(address, block):
+    return Transaction(
+        hash=f"0x{block:064x}",
+        block_number=block,
+        timestamp=0,
+        from_address=address,
+        to_address="0x" + "0" * 40,
+        value="0x0",
+    )
+
+
+TRANSFER = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+ADDRESS = "0x" + "ab" * 20
+
+
+def transfer_log(block, sender, recipient):
+    return {
+        "address": "0x" + "11" * 20,
+        "blockNumber": hex(block),
+        "transactionHash": f"0x{block:064x}",
+        "data": "0x01",
+        "topics": [TRANSFER, "0x" + "0" * 24 + sender[2:], "0x" + "0" * 24 + recipient[2:]],
+    }
+
+
+class FakeRPCManager:
+    """Answers eth_getLogs batches with one matching transfer at each chunk's first block"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.batches = []
+
+    def batch_call(self, calls, custom_timeout=None, return_errors=False):
+        self.batches.append(calls)
+        results = []
+        for method, params in calls:
+            if method == "eth_getBlockByNumber":
+                results.append({"timestamp": hex(1_700_000_000 + int(params[0], 16))})
+                continue
+            start = int(params[0]["fromBlock"], 16)
+            if start in self.failing:
+                error = tx_history_fetcher.RPCError("RPC error: query timeout exceeded")
+                if not return_errors:
+                    raise error
+                results.append(error)
+                continue
+            results.append([transfer_log(start, ADDRESS, "0x" + "cd" * 20)])
+        return results
+
+
+def test_batch_behaves_like_a_list_of_transactions():
+    batch = tx_history_fetcher.TransactionBatch()
+    for block in (5, 6, 7):
+        batch.append_from_log(transfer_log(block, ADDRESS, "0x" + "cd" * 20))
+
+    assert len(batch) == 3
+    assert batch.block_numbers == [5, 6, 7]
+    assert batch[1] == Transaction(
+        hash=f"0x{6:064x}",
+        block_number=6,
+        timestamp=0,
+        from_address=ADDRESS,
+        to_address="0x" + "cd" * 20,
+        value="0x01",
+        token_address="0x" + "11" * 20,
+    )
+    assert [tx.block_number for tx in batch[:2]] == [5, 6]
+    assert list(batch)[-1] == batch[-1]
+
+
+def test_chunks_are_sent_in_batches():
+    manager = FakeRPCManager()
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    txs = fetcher._fetch_txs_from_block(ADDRESS, 0, 5000 * 30, limit=25)
+
+    log_batches = [b for b in manager.batches if b[0][0] == "eth_getLogs"]
+    assert [len(b) for b in log_batches] == [20, 10]
+    assert [tx.block_number for tx in txs] == [i * 5001 for i in range(25)]
+
+
+def test_failed_ranges_only_skip_themselves():
+    manager = FakeRPCManager(failing={5001, 15003})
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    txs = fetcher._fetch_txs_from_block(ADDRESS, 0, 5000 * 5, limit=10)
+
+    assert [tx.block_number for tx in txs] == [0, 10002, 20004]
+
+
+def test_timestamps_are_fetched_once_per_block():
+    manager = FakeRPCManager()
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    first = fetcher._fetch_txs_from_block(ADDRESS, 0, 5000 * 2, limit=5)
+    second = fetcher._fetch_txs_from_block(ADDRESS, 0, 5000 * 3, limit=5)
+
+    assert first.timestamps == [1_700_000_000 + b for b in first.block_numbers]
+    assert second.timestamps == [1_700_000_000 + b for b in second.block_numbers]
+    block_batches = [b for b in manager.batches if b[0][0] == "eth_getBlockByNumber"]
+    assert [[int(params[0], 16) for _, params in b] for b in block_batches] == [
+        [0, 5001], [10002],
+    ]
+
+
+def test_timestamp_cache_is_shared_safely_across_workers(monkeypatch):
+    monkeypatch.setattr(tx_history_fetcher, "BLOCK_TIMESTAMP_CACHE_SIZE", 2)
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=FakeRPCManager())
+    errors = []
+
+    def worker(offset):
+        try:
+            for round_ in range(20):
+                txs = fetcher._fetch_txs_from_block(
+                    ADDRESS, offset * 100_000 + round_, offset * 100_000 + 5000 * 3, limit=4
+                )
+                assert txs.timestamps == [1_700_000_000 + b for b in txs.block_numbers]
+        except Exception as e:  # surfaced below; threads cannot fail the test directly
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(fetcher._block_timestamps) <= 2
+
+
+def test_matches_beyond_the_first_logs_are_found():
+    other = "0x" + "cd" * 20
+
+    class NoisyRPCManager:
+        def batch_call(self, calls, custom_timeout=None, return_errors=False):
+            noise = [transfer_log(1, other, other) for _ in range(50)]
+            hit = transfer_log(2, other, ADDRESS.upper().replace("0X", "0x"))
+            short = dict(transfer_log(3, other, ADDRESS), topics=[TRANSFER])
+            return [noise + [short, hit]] + [[] for _ in calls[1:]]
+
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=NoisyRPCManager())
+    txs = fetcher._fetch_txs_from_block(ADDRESS, 0, 100, limit=5)
+
+    assert [tx.block_number for tx in txs] == [2]
+    assert txs[0].from_address == other
+
+
+def test_activity_check_is_one_batched_round_trip():
+    manager = FakeRPCManager()
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    assert fetcher._check_block_range_activity(ADDRESS, 100, 5100)
+    assert len(manager.batches) == 1
+    assert len(manager.batches[0]) == 2
+
+
+class ActivityRPCManager:
+    """Transfers to ADDRESS at fixed blocks; records every eth_getLogs range"""
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.ranges = []
+        self.batches = 0
+
+    def batch_call(self, calls, custom_timeout=None, return_errors=False):
+        self.batches += 1
+        results = []
+        for method, params in calls:
+            start = int(params[0]["fromBlock"], 16)
+            end = int(params[0]["toBlock"], 16)
+            self.ranges.append((start, end))
+            incoming = len(params[0]["topics"]) == 3
+            results.append([
+                transfer_log(b, "0x" + "cd" * 20, ADDRESS)
+                for b in self.blocks if incoming and start <= b <= end
+            ])
+        return results
+
+
+def test_address_topic_is_left_padded_lowercase():
+    topic = tx_history_fetcher._address_topic("0x" + "AB" * 20)
+
+    assert topic == "0x" + "0" * 24 + "ab" * 20
+    assert len(topic) == 66
+
+
+def test_narrow_range_uses_one_unfiltered_query():
+    other = "0x" + "cd" * 20
+    manager = mock.Mock()
+    manager.call.return_value = [
+        transfer_log(10, other, other),
+        transfer_log(11, other, ADDRESS),
+        transfer_log(12, ADDRESS, other),
+    ]
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    incoming, outgoing = fetcher._transfer_logs(ADDRESS, 10, 20)
+
+    assert [int(l["blockNumber"], 16) for l in incoming] == [11]
+    assert [int(l["blockNumber"], 16) for l in outgoing] == [12]
+    manager.call.assert_called_once()
+    manager.batch_call.assert_not_called()
+    assert len(manager.call.call_args.args[1][0]["topics"]) == 1
+
+
+def test_wide_ranges_are_split_into_one_batch():
+    manager = ActivityRPCManager([15_000, 35_000])
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    incoming, outgoing = fetcher._transfer_logs(ADDRESS, 0, 40_000)
+
+    assert [int(log["blockNumber"], 16) for log in incoming] == [15_000, 35_000]
+    assert outgoing == []
+    assert manager.batches == 1
+    assert manager.ranges[::2] == [
+        (0, 10_000), (10_001, 20_001), (20_002, 30_002), (30_003, 40_000),
+    ]
+
+
+def test_wide_range_keeps_filtered_queries():
+    manager = ActivityRPCManager([])
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    fetcher._transfer_logs(ADDRESS, 0, tx_history_fetcher.FUSED_QUERY_MAX_RANGE + 1)
+
+    assert len(manager.ranges) == 2
+
+
+def test_small_window_is_scanned_in_one_query():
+    manager = ActivityRPCManager([4321, 9000])
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    assert fetcher._binary_search_first_block(ADDRESS, 0, 9999) == 4321
+
+    # Activity check plus a single linear scan, each as an in/out pair
+    assert manager.ranges == [(0, 9999)] * 4
+
+
+def test_large_window_bisects_until_it_fits_a_chunk():
+    manager = ActivityRPCManager([1234])
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    assert fetcher._binary_search_first_block(ADDRESS, 0, 40_000) == 1234
+    assert manager.ranges[-1] == (0, 10_000)
+
+
+def test_gallops_forward_to_first_active_window():
+    manager = ActivityRPCManager([35_000])
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    assert fetcher._binary_search_first_block(ADDRESS, 0, 1_000_000) == 35_000
+
+    probes = manager.ranges[::2]
+    # Gallop windows (0-10_000, 10_001-30_001, 30_002-70_002) are queried end
+    # to end, split into sub-ranges no wider than ACTIVITY_CHUNK_SIZE
+    assert probes[:5] == [
+        (0, 10_000), (10_001, 20_001), (20_002, 30_001), (30_002, 40_002), (40_003, 50_003),
+    ]
+    assert probes[-1] == (30_002, 40_002)
+    assert manager.batches < 8
+
+
+@pytest.mark.parametrize("first", [25_000, 60_000, 1_234_567, 19_000_000])
+def test_activity_anywhere_in_a_wide_window_is_found(first):
+    manager = ActivityRPCManager([first, first + 7])
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    assert fetcher._binary_search_first_block(ADDRESS, 0, 20_000_000) == first
+
+
+def test_no_activity_probes_until_end():
+    manager = ActivityRPCManager([])
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    assert fetcher._binary_search_first_block(ADDRESS, 0, 100_000) is None
+
+    # One batch per gallop window; together the sub-ranges cover every block
+    probes = manager.ranges[::2]
+    assert manager.batches == 4
+    assert probes[0][0] == 0 and probes[-1][1] == 100_000
+    assert all(b[0] == a[1] + 1 for a, b in zip(probes, probes[1:]))
+    assert all(end - start <= tx_history_fetcher.ACTIVITY_CHUNK_SIZE for start, end in probes)
+
+
+def test_failed_probe_is_not_read_as_inactive():
+    manager = mock.Mock()
+    manager.batch_call.side_effect = tx_history_fetcher.AllRPCsFailedError("down")
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    with pytest.raises(tx_history_fetcher.AllRPCsFailedError):
+        fetcher._binary_search_first_block(ADDRESS, 0, 100_000)
+
+
+def test_failed_final_scan_is_not_read_as_inactive():
+    manager = ActivityRPCManager([4321])
+    probe = manager.batch_call
+
+    def batch_call(calls, custom_timeout=None, return_errors=False):
+        # The activity probe succeeds, the linear scan that follows fails
+        if manager.ranges:
+            raise tx_history_fetcher.AllRPCsFailedError("down")
+        return probe(calls, custom_timeout, return_errors)
+
+    manager.batch_call = batch_call
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager)
+
+    with pytest.raises(tx_history_fetcher.AllRPCsFailedError):
+        fetcher._binary_search_first_block(ADDRESS, 0, 9999)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return tx_history_fetcher.CacheManager(cache_dir=tmp_path)
+
+
+@pytest.fixture
+def cached_fetcher(cache):
+    manager = mock.Mock()
+    manager.call.return_value = hex(1_000_000)
+    fetcher = TransactionHistoryFetcher("bsc", rpc_manager=manager, cache=cache)
+    fetcher.blockscout_url = None
+    fetcher._fetch_txs_from_block = mock.Mock(return_value=[make_tx(ADDRESS, 1)])
+    return fetcher
+
+
+def test_found_first_block_is_reused(cached_fetcher):
+    cached_fetcher._binary_search_first_block = mock.Mock(return_value=123_456)
+
+    cached_fetcher._rpc_get_first_txs(ADDRESS, 5)
+    cached_fetcher._rpc_get_first_txs(ADDRESS.upper().replace("0X", "0x"), 5)
+
+    cached_fetcher._binary_search_first_block.assert_called_once()
+    assert [c.args[1] for c in cached_fetcher._fetch_txs_from_block.call_args_list] == [
+        123_456, 123_456,
+    ]
+
+
+def test_other_addresses_are_searched_from_scratch(cached_fetcher):
+    cached_fetcher._binary_search_first_block = mock.Mock(return_value=123_456)
+
+    cached_fetcher._rpc_get_first_txs(ADDRESS, 5)
+    cached_fetcher._rpc_get_first_txs("0x" + "ab" * 19 + "00", 5)
+
+    assert cached_fetcher._binary_search_first_block.call_count == 2
+    assert cached_fetcher._binary_search_first_block.call_args.args[1] == 0
+
+
+def test_addresses_without_activity_are_not_cached(cached_fetcher, cache):
+    cached_fetcher._binary_search_first_block = mock.Mock(return_value=None)
+
+    assert cached_fetcher._rpc_get_first_txs(ADDRESS, 5) is None
+    assert cache.stats()["entries"] == 0
+
+
+def blockscout_item(block):
+    return {
+        "hash": f"0x{block:064x}",
+        "block": block,
+        "timestamp": "2024-03-01T12:00:00.000000Z",
+        "from": {"hash": ADDRESS},
+        "to": {"hash": "0x" + "cd" * 20},
+        "value": "0",
+        "method": "transfer",
+    }
+
+
+def test_parse_timestamp_handles_zulu_and_offsets():
+    parse = tx_history_fetcher._parse_timestamp
+
+    assert parse("2024-03-01T12:00:00Z") == 1709294400
+    assert parse("2024-03-01T12:00:00.123456Z") == 1709294400
+    assert parse("2024-03-01T14:00:00+02:00") == 1709294400
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.raw = io.BytesIO(json.dumps(body).encode())
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.raw.close()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        raise AssertionError("body must be decoded from the raw stream")
+
+
+def test_items_are_parsed_up_to_limit(monkeypatch):
+    body = {"items": [blockscout_item(b) for b in range(1, 6)]}
+    fetcher = TransactionHistoryFetcher("base")
+    requests_made = []
+    monkeypatch.setattr(
+        fetcher._http, "get",
+        lambda url, **kwargs: requests_made.append((url, kwargs)) or FakeResponse(body),
+    )
+
+    txs = fetcher._blockscout_get_first_txs(ADDRESS, 3)
+
+    (url, kwargs), = requests_made
+    assert kwargs["stream"] is True
+    assert url.startswith("https://base.blockscout.com/")
+    assert url.endswith("?filter=to%20%7C%20from&limit=3")
+    assert "gzip" in fetcher._http.headers["Accept-Encoding"]
+
+    assert [tx.block_number for tx in txs] == [1, 2, 3]
+    assert txs[0].timestamp == 1709294400
+    assert txs[0].method == "transfer"
+
+
+@pytest.mark.parametrize("body,status_code", [({}, 200), (None, 502)])
+def test_missing_items_or_http_error_returns_none(monkeypatch, body, status_code):
+    fetcher = TransactionHistoryFetcher("base")
+    monkeypatch.setattr(
+        fetcher._http, "get", lambda url, **kwargs: FakeResponse(body, status_code)
+    )
+
+    assert fetcher._blockscout_get_first_txs(ADDRESS, 3) is None
+
+
+def test_results_keep_input_order_and_skip_empty():
+    fetcher = TransactionHistoryFetcher("bsc")
+    addresses = [f"0x{i:040x}" for i in range(20)]
+
+    def fake_lookup(address, limit):
+        index = int(address, 16)
+        return [] if index % 5 == 0 else [make_tx(address, index)]
+
+    fetcher._get_address_first_txs = fake_lookup
+    results = fetcher.get_first_transactions(addresses, limit=3)
+
+    assert list(results) == [a for i, a in enumerate(addresses) if i % 5 != 0]
+    assert results[addresses[7]][0].block_number == 7
+
+
+def test_no_addresses():
+    assert TransactionHistoryFetcher("bsc").get_first_transactions([]) == {}
+
+
+def test_iterator_yields_as_lookups_complete():
+    fetcher = TransactionHistoryFetcher("bsc")
+    slow, fast = f"0x{1:040x}", f"0x{2:040x}"
+    release = threading.Event()
+
+    def fake_lookup(address, limit):
+        if address == slow:
+            release.wait(5)
+        return [make_tx(address, int(address, 16))]
+
+    fetcher._get_address_first_txs = fake_lookup
+    results = fetcher.iter_first_transactions([slow, fast])
+
+    assert next(results)[0] == fast
+    release.set()
+    assert next(results)[0] == slow
+    assert next(results, None) is None
+
+
+def test_stopping_early_cancels_queued_lookups():
+    fetcher = TransactionHistoryFetcher("bsc")
+    addresses = [f"0x{i:040x}" for i in range(tx_history_fetcher.FETCH_MAX_WORKERS * 4)]
+    release = threading.Event()
+    calls = []
+
+    def fake_lookup(address, limit):
+        calls.append(address)
+        if address != addresses[0]:
+            release.wait(5)
+        return [make_tx(address, 1)]
+
+    fetcher._get_address_first_txs = fake_lookup
+    results = fetcher.iter_first_transactions(addresses)
+    assert next(results)[0] == addresses[0]
+    results.close()
+    release.set()
+
+    assert len(calls) <= tx_history_fetcher.FETCH_MAX_WORKERS + 1
+    assert list(fetcher.iter_first_transactions([])) == []
@@ -0,0 +1,138 @@
+import visualizer
+
+
+Visualizer = visualizer.Visualizer
+
+
+def make_holder(index, balance_pct):
+    return {"address": f"0x{index:040x}", "balance_pct": balance_pct}
+
+
+def test_holder_bars_scale_to_largest_holding():
+    chart = Visualizer(width=45).generate_holder_distribution(
+        [make_holder(1, 10.0), make_holder(2, 5.0), make_holder(3, 0.0)]
+    )
+
+    lines = chart.split("\n")
+    assert lines[0] == "=" * 45
+    assert lines[-1] == "=" * 45
+    assert lines[4] == " 1. 0x0000...0001 " + "█" * 20 + " 10.00%"
+    assert lines[5] == " 2. 0x0000...0002 " + "█" * 10 + "  5.00%"
+    assert lines[6] == " 3. 0x0000...0003   0.00%"
+
+
+def test_distribution_keeps_top_n_in_order():
+    holders = [make_holder(i, (i * 37) % 101 / 10) for i in range(500)]
+    chart = Visualizer().generate_holder_distribution(holders, top_n=3)
+
+    expected = sorted(holders, key=lambda h: h["balance_pct"], reverse=True)[:3]
+    rows = chart.split("\n")[4:7]
+    assert [row[-6:] for row in rows] == [f"{h['balance_pct']:5.2f}%" for h in expected]
+    assert len(chart.split("\n")) == 9
+
+
+def test_risk_gauge_bars():
+    gauge = Visualizer(width=60).generate_risk_gauge(75.0, 50.0)
+
+    assert "Risk Score:       " + "█" * 30 + " 75.0/100" in gauge
+    assert "Risk Level:       🔴 CRITICAL" in gauge
+    assert "Confidence:       " + "█" * 20 + " 50.0/100" in gauge
+
+
+def test_negative_scores_draw_empty_bars():
+    gauge = Visualizer(width=60).generate_risk_gauge(-10.0, -5.0)
+
+    assert "█" not in gauge
+    assert "Risk Score:        -10.0/100" in gauge
+    assert "Confidence:        -5.0/100" in gauge
+
+
+def test_empty_holders():
+    assert Visualizer().generate_holder_distribution([]) == "No holder data available"
+
+
+def test_suspicious_summary_layout():
+    summary = Visualizer(width=30).generate_suspicious_summary([
+        {"address": "0x" + "ab" * 20, "risk_score": 80, "flags": ["A", "B", "C", "D"]},
+        {"address": "0x" + "cd" * 20, "risk_score": 40},
+    ])
+
+    assert summary.split("\n") == [
+        "=" * 30,
+        "Suspicious Holders (2)",
+        "=" * 30,
+        "",
+        " 1. 🔴 0xababab...ababab  Risk:  80/100",
+        "    Flags: A, B, C",
+        "",
+        " 2. 🟡 0xcdcdcd...cdcdcd  Risk:  40/100",
+        "",
+        "=" * 30,
+    ]
+
+
+def test_cluster_summary_layout():
+    summary = Visualizer(width=20).generate_cluster_summary([
+        {"id": "c1", "members": ["a", "b"], "total_percentage": 3.5,
+         "risk_score": 42, "signals": ["x", "y", "z"]},
+    ])
+
+    assert summary.split("\n") == [
+        "=" * 20,
+        "Holder Clusters (1)",
+        "=" * 20,
+        "",
+        "1. c1",
+        "   Members: 2",
+        "   Holdings: 3.50%",
+        "   Risk: 42.0/100",
+        "   Signals: x, y",
+        "",
+        "=" * 20,
+    ]
+
+
+def test_timestamps_are_formatted_once_per_string():
+    visualizer._fmt_ts.cache_clear()
+    events = [
+        {"timestamp": "2024-03-01T12:30:45Z", "type": "deploy"},
+        {"timestamp": "2024-03-01T12:30:45Z", "type": "launch"},
+        {"timestamp": "not-a-timestamp-at-all", "type": "info"},
+        {"timestamp": 1700000000, "type": "alert"},
+    ]
+
+    lines = Visualizer().generate_timeline(events).split("\n")
+
+    assert lines[4] == "2024-03-01 12:30 🚀 deploy"
+    assert lines[6] == "2024-03-01 12:30 🎯 launch"
+    assert lines[8] == "not-a-timestamp- ℹ️ info"
+    assert lines[10] == "1700000000 🚨 alert"
+    info = visualizer._fmt_ts.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_unknown_or_missing_event_type_uses_bullet():
+    lines = Visualizer().generate_timeline([
+        {"timestamp": "2024-03-01T12:30:45", "type": "Suspicious"},
+        {"timestamp": "2024-03-01T12:30:45", "type": "other"},
+        {"timestamp": "2024-03-01T12:30:45", "type": None},
+    ]).split("\n")
+
+    assert lines[4] == "2024-03-01 12:30 ⚠️ Suspicious"
+    assert lines[6] == "2024-03-01 12:30 • other"
+    assert lines[8] == "2024-03-01 12:30 • None"
+
+
+def test_descriptions_wrap_on_words_within_width():
+    description = "alpha beta gamma delta epsilon zeta-eta-theta-iota-kappa mu"
+    lines = Visualizer(width=20).generate_timeline(
+        [{"timestamp": "2024-03-01T12:30:45", "type": "info", "description": description}]
+    ).split("\n")
+
+    assert lines[5:9] == [
+        "  alpha beta gamma",
+        "  delta epsilon",
+        "  zeta-eta-theta-iota-kappa",
+        "  mu",
+    ]
+    assert lines[9] == ""